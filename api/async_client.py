@@ -4,6 +4,12 @@ import httpx
 from typing import Optional, Dict, Any
 from abc import ABC
 
+# orjson 解析速度更快，未安装时回退到 httpx 自带的 json 解析
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class AsyncAPIClient(ABC):
     """异步API客户端基类"""
@@ -69,7 +75,7 @@ class AsyncAPIClient(ABC):
         try:
             response = await client.request(method, url, **request_kwargs)
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content) if orjson else response.json()
             
             return {
                 "success": True,
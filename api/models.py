@@ -108,7 +108,7 @@ class ModelsAPI(AsyncAPIClient):
         
         return result
     
-    async def download_model_package(self, uuid: str, save_dir: str, progress_callback=None) -> Dict[str, Any]:
+    async def download_model_package(self, uuid: str, save_dir: str, progress_callback=None, memory_limit: int = 0) -> Dict[str, Any]:
         """
         下载模型压缩包（.7z文件）（异步）
         
@@ -116,11 +116,14 @@ class ModelsAPI(AsyncAPIClient):
             uuid: 模型UUID
             save_dir: 保存目录（不包含文件名）
             progress_callback: 进度回调函数，接收 (downloaded, total) 参数
+            memory_limit: 响应头给出文件大小且不超过该值时下载到内存，不写入磁盘（0 表示总是写入磁盘）
         
         Returns:
-            下载结果字典，包含 file_path（完整路径）和 file_name（文件名）
+            下载结果字典，包含 file_name（文件名），以及 file_path（完整路径）
+            或 file_data（下载到内存时的 BytesIO，已定位到开头）
         """
         import httpx
+        import io
         import os
         import re
         
@@ -157,19 +160,38 @@ class ModelsAPI(AsyncAPIClient):
                         if not filename or filename == 'package':
                             filename = f"{uuid}.7z"
                     
-                    # 确保保存目录存在
-                    os.makedirs(save_dir, exist_ok=True)
-                    
-                    # 构建完整保存路径
-                    save_path = os.path.join(save_dir, filename)
+                    # 大小已知且不大时下载到内存，调用方直接从内存解压，省去写入再读回压缩包
+                    in_memory = 0 < total_size <= memory_limit
+                    if in_memory:
+                        f = io.BytesIO()
+                    else:
+                        # 确保保存目录存在
+                        os.makedirs(save_dir, exist_ok=True)
+                        
+                        # 构建完整保存路径
+                        save_path = os.path.join(save_dir, filename)
+                        f = open(save_path, "wb")
                     
                     downloaded = 0
-                    with open(save_path, "wb") as f:
+                    try:
                         async for chunk in response.aiter_bytes():
                             f.write(chunk)
                             downloaded += len(chunk)
                             if progress_callback and total_size > 0:
                                 progress_callback(downloaded, total_size)
+                    finally:
+                        if not in_memory:
+                            f.close()
+                    
+                    if in_memory:
+                        f.seek(0)
+                        return {
+                            "success": True,
+                            "message": "下载完成",
+                            "file_data": f,
+                            "file_name": filename,
+                            "file_size": downloaded
+                        }
                     
                     return {
                         "success": True,
@@ -3,19 +3,25 @@ import os
 import re
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QLineEdit, QCheckBox, QFrame, QMessageBox, QStackedWidget
+    QLineEdit, QCheckBox, QFrame, QMessageBox, QStackedWidget, QSizePolicy
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QRegularExpression
+from PyQt6.QtGui import QCursor, QRegularExpressionValidator
 from api.auth import auth_api
 from api.async_utils import AsyncTaskManager
 from api.storage import token_storage
 from utils.mac_address import get_mac_address
 
+# 手机号格式（模块级预编译）
+_PHONE_RE = re.compile(r'1[3-9]\d{9}')
+
 
 class PasswordWidget(QLineEdit):
     """密码输入框容器（按钮在输入框内部）"""
     def __init__(self, parent=None):
         super().__init__(parent)
+        # 手型光标只创建一次，供按钮和悬停检测复用
+        self._hand_cursor = QCursor(Qt.CursorShape.PointingHandCursor)
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(0, 0, 12, 0)
@@ -23,8 +29,9 @@ class PasswordWidget(QLineEdit):
         
         self.toggle_btn = QPushButton(self)
         self.toggle_btn.setFixedSize(24, 24)
-        self.toggle_btn.setProperty("auth_password_hide", True)
-        self.toggle_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self._hidden = True  # 密码是否隐藏，属性仅用于样式匹配
+        self.toggle_btn.setProperty("auth_password_hide", self._hidden)
+        self.toggle_btn.setCursor(self._hand_cursor)
         self.setEchoMode(QLineEdit.EchoMode.Password)
         self.toggle_btn.clicked.connect(self.on_toggle_btn_clicked)
         layout.addStretch()
@@ -34,14 +41,14 @@ class PasswordWidget(QLineEdit):
         self._default_cursor = self.cursor()
 
     def on_toggle_btn_clicked(self):
-        if self.toggle_btn.property("auth_password_hide"):
-            self.toggle_btn.setProperty("auth_password_show", True)
-            self.toggle_btn.setProperty("auth_password_hide", False)
-        else:
-            self.toggle_btn.setProperty("auth_password_hide", True)
-            self.toggle_btn.setProperty("auth_password_show", False)
-        self.setEchoMode(QLineEdit.EchoMode.Password if self.toggle_btn.property("auth_password_hide") else QLineEdit.EchoMode.Normal)
-        self.toggle_btn.style().polish(self.toggle_btn)
+        self._hidden = not self._hidden
+        self.toggle_btn.setProperty("auth_password_hide", self._hidden)
+        self.toggle_btn.setProperty("auth_password_show", not self._hidden)
+        self.setEchoMode(QLineEdit.EchoMode.Password if self._hidden else QLineEdit.EchoMode.Normal)
+        # 属性全部更新后只刷新一次样式
+        style = self.toggle_btn.style()
+        style.unpolish(self.toggle_btn)
+        style.polish(self.toggle_btn)
     
     def mouseMoveEvent(self, event):
         """鼠标移动时检查是否在按钮区域内"""
@@ -52,7 +59,7 @@ class PasswordWidget(QLineEdit):
         # 检查鼠标是否在按钮区域内
         if btn_rect.contains(event.pos()):
             # 在按钮区域内，设置为手型光标
-            self.setCursor(Qt.CursorShape.PointingHandCursor)
+            self.setCursor(self._hand_cursor)
         else:
             # 不在按钮区域内，恢复默认光标（文本输入光标）
             self.setCursor(self._default_cursor)
@@ -68,6 +75,28 @@ class PasswordWidget(QLineEdit):
         super().leaveEvent(event)
         self.setCursor(self._default_cursor)
 
+
+# 对话框子控件样式：统一在对话框容器上设置一次，不再逐个控件设置
+# （全局 style.qss 中的背景色会被外层 transparent 样式覆盖，所以放在这里）
+_DIALOG_QSS = (
+    "QLineEdit { background-color: white; }"
+    "QPushButton[auth_primary=true] { background-color: #0068B7; }"
+)
+
+# 登录/注册输入框定义：(属性名, 占位文本, 控件类)
+LOGIN_FIELDS = [
+    ('login_username_input', '账号', QLineEdit),
+    ('login_password_input', '密码', PasswordWidget),
+]
+
+REGISTER_FIELDS = [
+    ('register_username_input', '用户名', QLineEdit),
+    ('register_password_input', '密码', PasswordWidget),
+    ('phone_input', '手机号码', QLineEdit),
+    ('activation_input', '激活码 (请联系客服人员获取)', QLineEdit),
+]
+
+
 class AuthPage(QWidget):
     """登录和注册统一页面"""
     login_success = pyqtSignal(str, str)  # 发送用户名和密码
@@ -76,7 +105,12 @@ class AuthPage(QWidget):
     def __init__(self):
         super().__init__()
         self.task_manager = AsyncTaskManager()  # 异步任务管理器
+        self._auth_in_flight = False  # 是否有登录/注册请求正在进行
         self.init_ui()
+        # 提示框只创建一次，所有警告复用
+        self._warn_box = QMessageBox(self)
+        self._warn_box.setIcon(QMessageBox.Icon.Warning)
+        self._warn_box.setStandardButtons(QMessageBox.StandardButton.Ok)
         # 加载保存的凭据
         self.load_saved_credentials()
     
@@ -95,9 +129,8 @@ class AuthPage(QWidget):
         self.login_view = self.create_login_view()
         self.stack.addWidget(self.login_view)
         
-        # 创建注册视图
-        self.register_view = self.create_register_view()
-        self.stack.addWidget(self.register_view)
+        # 注册视图在首次切换时再创建
+        self.register_view = None
         
         # 默认显示登录视图
         self.stack.setCurrentIndex(0)
@@ -106,8 +139,15 @@ class AuthPage(QWidget):
         main_layout.addWidget(self.stack, alignment=Qt.AlignmentFlag.AlignCenter)
         main_layout.addStretch()
     
-    def create_login_view(self):
-        """创建登录视图"""
+    def _build_dialog(self, title, height, title_spacing, fields):
+        """按字段表创建对话框视图，返回 (视图, 对话框布局)
+
+        Args:
+            title: 标题文本
+            height: 对话框高度
+            title_spacing: 标题与输入框之间的间距
+            fields: 输入框定义列表，每项为 (属性名, 占位文本, 控件类)
+        """
         view = QWidget()
         view.setStyleSheet("background: transparent;")
         
@@ -115,36 +155,73 @@ class AuthPage(QWidget):
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(0)
         
-        # 创建登录对话框容器
+        # 创建对话框容器
         dialog_frame = QFrame()
         dialog_frame.setProperty("login_bg", True)
-        dialog_frame.setFixedSize(400, 500)
+        dialog_frame.setFixedSize(400, height)
+        dialog_frame.setStyleSheet(_DIALOG_QSS)
         
         dialog_layout = QVBoxLayout(dialog_frame)
         dialog_layout.setContentsMargins(40, 40, 40, 40)
         dialog_layout.setSpacing(20)
         
         # 标题
-        title_label = QLabel("欢迎来到娱音Ai!")
+        title_label = QLabel(title)
         title_label.setProperty("auth_title", True)
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         dialog_layout.addWidget(title_label)
         
-        dialog_layout.addSpacing(20)
+        dialog_layout.addSpacing(title_spacing)
+        
+        # 输入框
+        for attr_name, placeholder, widget_cls in fields:
+            field = widget_cls()
+            field.setPlaceholderText(placeholder)
+            field.setProperty("auth_input", True)
+            dialog_layout.addWidget(field)
+            setattr(self, attr_name, field)
+        
+        main_layout.addStretch()
+        main_layout.addWidget(dialog_frame, alignment=Qt.AlignmentFlag.AlignCenter)
+        main_layout.addStretch()
+        
+        return view, dialog_layout
+    
+    def _create_primary_button(self, text, slot):
+        """创建对话框主按钮"""
+        btn = QPushButton(text)
+        btn.setProperty("auth_primary", True)
+        btn.clicked.connect(slot)
+        return btn
+    
+    def _create_link_button(self, text, style_property, slot):
+        """创建链接样式的扁平按钮"""
+        link = QPushButton(text)
+        link.setFlat(True)
+        # 按钮默认垂直方向固定高度，改回与 QLabel 相同的 Preferred，保持原来的对话框布局
+        link.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+        link.setProperty(style_property, True)
+        link.setCursor(Qt.CursorShape.PointingHandCursor)
+        link.clicked.connect(slot)
+        return link
+    
+    def _create_switch_layout(self, text, link_text, slot):
+        """创建“没有账号?/已有账号?”切换链接行"""
+        switch_layout = QHBoxLayout()
+        switch_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        
+        switch_text = QLabel(text)
+        switch_text.setProperty("auth_text_secondary", True)
+        switch_layout.addWidget(switch_text)
         
-        # 账号输入框
-        self.login_username_input = QLineEdit()
-        self.login_username_input.setPlaceholderText("账号")
-        self.login_username_input.setProperty("auth_input", True)
-        self.login_username_input.setStyleSheet("background-color: white;")
-        dialog_layout.addWidget(self.login_username_input)
+        switch_link = self._create_link_button(link_text, "auth_link", slot)
+        switch_layout.addWidget(switch_link)
         
-        # 密码输入框容器（用于将按钮放在输入框内部）
-        self.login_password_input = PasswordWidget()
-        self.login_password_input.setPlaceholderText("密码")
-        self.login_password_input.setProperty("auth_input", True)
-        self.login_password_input.setStyleSheet("background-color: white;")
-        dialog_layout.addWidget(self.login_password_input)
+        return switch_layout
+    
+    def create_login_view(self):
+        """创建登录视图"""
+        view, dialog_layout = self._build_dialog("欢迎来到娱音Ai!", 500, 20, LOGIN_FIELDS)
         
         # 选项行
         options_layout = QHBoxLayout()
@@ -160,36 +237,17 @@ class AuthPage(QWidget):
         options_layout.addStretch()
         
         # 忘记密码链接
-        forgot_password_label = QLabel("忘记密码?")
-        forgot_password_label.setProperty("auth_link", True)
-        forgot_password_label.setCursor(Qt.CursorShape.PointingHandCursor)
-        forgot_password_label.mousePressEvent = lambda e: self.on_forgot_password()
-        options_layout.addWidget(forgot_password_label)
+        forgot_password_link = self._create_link_button("忘记密码?", "auth_link", self.on_forgot_password)
+        options_layout.addWidget(forgot_password_link)
         
         dialog_layout.addLayout(options_layout)
         
         # 登录按钮
-        self.login_btn = QPushButton("登录")
-        self.login_btn.setProperty("auth_primary", True)
-        self.login_btn.setStyleSheet("background-color: #0068B7;")   # 不知为啥在style.qss中设置背景颜色无效
-        self.login_btn.clicked.connect(self.on_login)
+        self.login_btn = self._create_primary_button("登录", self.on_login)
         dialog_layout.addWidget(self.login_btn)
         
         # 注册链接
-        register_layout = QHBoxLayout()
-        register_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        register_text = QLabel("没有账号?")
-        register_text.setProperty("auth_text_secondary", True)
-        register_layout.addWidget(register_text)
-        
-        register_link = QLabel("立即注册")
-        register_link.setProperty("auth_link", True)
-        register_link.setCursor(Qt.CursorShape.PointingHandCursor)
-        register_link.mousePressEvent = lambda e: self.show_register()
-        register_layout.addWidget(register_link)
-        
-        dialog_layout.addLayout(register_layout)
+        dialog_layout.addLayout(self._create_switch_layout("没有账号?", "立即注册", self.show_register))
         
         # 用户协议
         agreement_link_layout = QHBoxLayout()
@@ -200,101 +258,31 @@ class AuthPage(QWidget):
         self.agreement_checkbox.setText("我已详细阅读并同意")
         agreement_link_layout.addWidget(self.agreement_checkbox)
         
-        agreement_link = QLabel("《用户协议》")
-        agreement_link.setProperty("auth_link_small", True)
-        agreement_link.setCursor(Qt.CursorShape.PointingHandCursor)
-        agreement_link.mousePressEvent = lambda e: self.on_agreement_clicked()
+        agreement_link = self._create_link_button("《用户协议》", "auth_link_small", self.on_agreement_clicked)
         agreement_link_layout.addWidget(agreement_link)
         agreement_link_layout.addStretch()
         
         dialog_layout.addLayout(agreement_link_layout)
         
-        main_layout.addStretch()
-        main_layout.addWidget(dialog_frame, alignment=Qt.AlignmentFlag.AlignCenter)
-        main_layout.addStretch()
-        
         return view
     
     def create_register_view(self):
         """创建注册视图"""
-        view = QWidget()
-        view.setStyleSheet("background: transparent;")
-        
-        main_layout = QVBoxLayout(view)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.setSpacing(0)
-        
-        # 创建注册对话框容器
-        dialog_frame = QFrame()
-        dialog_frame.setProperty("login_bg", True)
-        dialog_frame.setFixedSize(400, 550)
+        view, dialog_layout = self._build_dialog("Welcome to 布丁!", 550, 10, REGISTER_FIELDS)
         
-        dialog_layout = QVBoxLayout(dialog_frame)
-        dialog_layout.setContentsMargins(40, 40, 40, 40)
-        dialog_layout.setSpacing(20)
-        
-        # 标题
-        title_label = QLabel("Welcome to 布丁!")
-        title_label.setProperty("auth_title", True)
-        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        dialog_layout.addWidget(title_label)
-        
-        dialog_layout.addSpacing(10)
-        
-        # 用户名输入框
-        self.register_username_input = QLineEdit()
-        self.register_username_input.setPlaceholderText("用户名")
-        self.register_username_input.setProperty("auth_input", True)
-        self.register_username_input.setStyleSheet("background-color: white;")
-        dialog_layout.addWidget(self.register_username_input)
-        
-        # 密码输入框容器（用于将按钮放在输入框内部）
-        self.register_password_input = PasswordWidget()
-        self.register_password_input.setPlaceholderText("密码")
-        self.register_password_input.setProperty("auth_input", True)
-        self.register_password_input.setStyleSheet("background-color: white;")
-        dialog_layout.addWidget(self.register_password_input)
-        
-        # 手机号码输入框
-        self.phone_input = QLineEdit()
-        self.phone_input.setPlaceholderText("手机号码")
-        self.phone_input.setProperty("auth_input", True)
-        self.phone_input.setStyleSheet("background-color: white;")
-        dialog_layout.addWidget(self.phone_input)
-        
-        # 激活码输入框
-        self.activation_input = QLineEdit()
-        self.activation_input.setPlaceholderText("激活码 (请联系客服人员获取)")
-        self.activation_input.setProperty("auth_input", True)
-        self.activation_input.setStyleSheet("background-color: white;")
-        dialog_layout.addWidget(self.activation_input)
+        # 手机号输入时即限制格式，只能输入合法号码的前缀
+        self.phone_input.setValidator(
+            QRegularExpressionValidator(QRegularExpression(_PHONE_RE.pattern), self.phone_input)
+        )
+        self.phone_input.setMaxLength(11)
+        self.phone_input.setInputMethodHints(Qt.InputMethodHint.ImhDigitsOnly)
         
         # 注册按钮
-        self.register_btn = QPushButton("注册")
-        self.register_btn.setProperty("auth_primary", True)
-        self.register_btn.setStyleSheet("background-color: #0068B7;")   # 不知为啥在style.qss中设置背景颜色无效
-        self.register_btn.clicked.connect(self.on_register)
+        self.register_btn = self._create_primary_button("注册", self.on_register)
         dialog_layout.addWidget(self.register_btn)
         
         # 登录链接
-        login_layout = QHBoxLayout()
-        login_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        login_text = QLabel("已有账号?")
-        login_text.setProperty("auth_text_secondary", True)
-        login_layout.addWidget(login_text)
-        
-        login_link = QLabel("立即登录")
-        login_link.setProperty("auth_link", True)
-        login_link.setCursor(Qt.CursorShape.PointingHandCursor)
-        login_link.mousePressEvent = lambda e: self.show_login()
-        login_layout.addWidget(login_link)
-        
-        dialog_layout.addLayout(login_layout)
-        
-        main_layout.addStretch()
-        main_layout.addWidget(dialog_frame, alignment=Qt.AlignmentFlag.AlignCenter)
-        main_layout.addStretch()
+        dialog_layout.addLayout(self._create_switch_layout("已有账号?", "立即登录", self.show_login))
         
         return view
     
@@ -309,40 +297,39 @@ class AuthPage(QWidget):
     
     def show_login(self):
         """显示登录视图"""
-        self.stack.setCurrentIndex(0)
+        self.stack.setCurrentWidget(self.login_view)
     
     def show_register(self):
         """显示注册视图"""
-        self.stack.setCurrentIndex(1)
+        if self.register_view is None:
+            self.register_view = self.create_register_view()
+            self.stack.addWidget(self.register_view)
+        self.stack.setCurrentWidget(self.register_view)
     
     def on_login(self):
         """登录按钮点击"""
-        username = self.login_username_input.text().strip()
-        password = self.login_password_input.text().strip()
-        
-        if not username:
-            QMessageBox.warning(self, "提示", "请输入账号")
+        if self._auth_in_flight:
             return
         
-        if not password:
-            QMessageBox.warning(self, "提示", "请输入密码")
-            return
+        username = self.login_username_input.text().strip()
+        password = self.login_password_input.text().strip()
         
-        if not self.agreement_checkbox.isChecked():
-            QMessageBox.warning(self, "提示", "请先同意用户协议")
+        if not self._validate([
+            (username, bool, "请输入账号"),
+            (password, bool, "请输入密码"),
+            (self.agreement_checkbox.isChecked(), bool, "请先同意用户协议"),
+        ]):
             return
         
         # 禁用登录按钮
-        self.login_btn.setEnabled(False)
-        self.login_btn.setText("登录中...")
+        self._set_auth_busy(self.login_btn, "登录中...")
         
         # 获取MAC地址
         try:
             mac = get_mac_address()
         except Exception as e:
-            QMessageBox.warning(self, "错误", f"获取设备信息失败: {e}")
-            self.login_btn.setEnabled(True)
-            self.login_btn.setText("登录")
+            self._show_warning("错误", f"获取设备信息失败: {e}")
+            self._clear_auth_busy(self.login_btn, "登录")
             return
         
         # 异步调用登录API
@@ -362,11 +349,22 @@ class AuthPage(QWidget):
         # 启动线程
         thread.start()
     
+    def _set_auth_busy(self, btn, busy_text):
+        """标记请求进行中并禁用提交按钮，避免重复提交"""
+        self._auth_in_flight = True
+        btn.setEnabled(False)
+        btn.setText(busy_text)
+    
+    def _clear_auth_busy(self, btn, text):
+        """请求结束，恢复提交按钮"""
+        self._auth_in_flight = False
+        btn.setEnabled(True)
+        btn.setText(text)
+    
     def _on_login_result(self, username: str, password: str, result: dict):
         """登录结果处理"""
         # 恢复登录按钮
-        self.login_btn.setEnabled(True)
-        self.login_btn.setText("登录")
+        self._clear_auth_busy(self.login_btn, "登录")
         
         if result.get("success"):
             # 如果勾选了"保存密码"，保存用户名和密码
@@ -384,77 +382,81 @@ class AuthPage(QWidget):
             
             # 检查是否是MAC地址相关的错误
             if "设备" in error_message or "mac" in error_message.lower() or "其他设备" in error_message:
-                QMessageBox.warning(self, "登录失败", error_message)
+                self._show_warning("登录失败", error_message)
             else:
-                QMessageBox.warning(self, "登录失败", error_message)
+                self._show_warning("登录失败", error_message)
     
     def _on_login_error(self, error: str):
         """登录错误处理"""
         # 恢复登录按钮
-        self.login_btn.setEnabled(True)
-        self.login_btn.setText("登录")
+        self._clear_auth_busy(self.login_btn, "登录")
         
         # 检查是否是MAC地址相关的错误
         if "设备" in error or "mac" in error.lower() or "其他设备" in error:
-            QMessageBox.warning(self, "登录失败", f"设备验证失败: {error}")
+            self._show_warning("登录失败", f"设备验证失败: {error}")
         else:
-            QMessageBox.warning(self, "登录错误", f"登录过程中发生错误: {error}")
+            self._show_warning("登录错误", f"登录过程中发生错误: {error}")
     
     def on_forgot_password(self):
         """忘记密码"""
         QMessageBox.information(self, "提示", "请联系客服找回密码")
     
+    def _show_warning(self, title, message):
+        """使用复用的提示框显示警告"""
+        self._warn_box.setWindowTitle(title)
+        self._warn_box.setText(message)
+        self._warn_box.exec()
+    
+    def _validate(self, checks):
+        """按顺序执行校验表，遇到第一个失败项时提示并返回 False
+        
+        Args:
+            checks: 校验列表，每项为 (值, 校验函数, 失败提示)
+        """
+        for value, predicate, message in checks:
+            if not predicate(value):
+                self._show_warning("提示", message)
+                return False
+        return True
+    
     def validate_phone(self, phone):
         """验证手机号格式"""
-        pattern = r'^1[3-9]\d{9}$'
-        return re.match(pattern, phone) is not None
+        return _PHONE_RE.fullmatch(phone) is not None
     
     def on_register(self):
         """注册按钮点击"""
-        username = self.register_username_input.text().strip()
-        password = self.register_password_input.text().strip()
-        phone = self.phone_input.text().strip()
-        activation_code = self.activation_input.text().strip()
-        
-        if not username:
-            QMessageBox.warning(self, "提示", "请输入用户名")
-            return
-        
-        if len(username) < 3:
-            QMessageBox.warning(self, "提示", "用户名至少3个字符")
-            return
-        
-        if not password:
-            QMessageBox.warning(self, "提示", "请输入密码")
-            return
-        
-        if len(password) < 6:
-            QMessageBox.warning(self, "提示", "密码至少6个字符")
+        if self._auth_in_flight:
             return
         
-        if not phone:
-            QMessageBox.warning(self, "提示", "请输入手机号码")
-            return
-        
-        if not self.validate_phone(phone):
-            QMessageBox.warning(self, "提示", "请输入正确的手机号码格式")
-            return
+        username, password, phone, activation_code = (
+            field.text().strip() for field in (
+                self.register_username_input,
+                self.register_password_input,
+                self.phone_input,
+                self.activation_input,
+            )
+        )
         
-        if not activation_code:
-            QMessageBox.warning(self, "提示", "请输入激活码")
+        if not self._validate([
+            (username, bool, "请输入用户名"),
+            (username, lambda v: len(v) >= 3, "用户名至少3个字符"),
+            (password, bool, "请输入密码"),
+            (password, lambda v: len(v) >= 6, "密码至少6个字符"),
+            (phone, bool, "请输入手机号码"),
+            (phone, self.validate_phone, "请输入正确的手机号码格式"),
+            (activation_code, bool, "请输入激活码"),
+        ]):
             return
         
         # 禁用注册按钮
-        self.register_btn.setEnabled(False)
-        self.register_btn.setText("注册中...")
+        self._set_auth_busy(self.register_btn, "注册中...")
         
         # 获取MAC地址
         try:
             mac = get_mac_address()
         except Exception as e:
-            QMessageBox.warning(self, "错误", f"获取设备信息失败: {e}")
-            self.register_btn.setEnabled(True)
-            self.register_btn.setText("注册")
+            self._show_warning("错误", f"获取设备信息失败: {e}")
+            self._clear_auth_busy(self.register_btn, "注册")
             return
         
         # 异步调用注册API
@@ -483,8 +485,7 @@ class AuthPage(QWidget):
     def _on_register_result(self, username: str, password: str, phone: str, activation_code: str, result: dict):
         """注册结果处理"""
         # 恢复注册按钮
-        self.register_btn.setEnabled(True)
-        self.register_btn.setText("注册")
+        self._clear_auth_busy(self.register_btn, "注册")
         
         if result.get("success"):
             # 注册成功，发送信号
@@ -496,30 +497,29 @@ class AuthPage(QWidget):
             # 检查是否是邀请码相关的错误
             if "邀请码" in error_message or "invitation" in error_message.lower():
                 if "不存在" in error_message:
-                    QMessageBox.warning(self, "邀请码错误", "邀请码不存在，请检查后重试")
+                    self._show_warning("邀请码错误", "邀请码不存在，请检查后重试")
                 elif "已被使用" in error_message or "已使用" in error_message:
-                    QMessageBox.warning(self, "邀请码错误", "该邀请码已被使用，请使用其他邀请码")
+                    self._show_warning("邀请码错误", "该邀请码已被使用，请使用其他邀请码")
                 else:
-                    QMessageBox.warning(self, "邀请码错误", error_message)
+                    self._show_warning("邀请码错误", error_message)
             else:
-                QMessageBox.warning(self, "注册失败", error_message)
+                self._show_warning("注册失败", error_message)
     
     def _on_register_error(self, error: str):
         """注册错误处理"""
         # 恢复注册按钮
-        self.register_btn.setEnabled(True)
-        self.register_btn.setText("注册")
+        self._clear_auth_busy(self.register_btn, "注册")
         
         # 检查是否是邀请码相关的错误
         if "邀请码" in error or "invitation" in error.lower():
             if "不存在" in error:
-                QMessageBox.warning(self, "邀请码错误", "邀请码不存在，请检查后重试")
+                self._show_warning("邀请码错误", "邀请码不存在，请检查后重试")
             elif "已被使用" in error or "已使用" in error:
-                QMessageBox.warning(self, "邀请码错误", "该邀请码已被使用，请使用其他邀请码")
+                self._show_warning("邀请码错误", "该邀请码已被使用，请使用其他邀请码")
             else:
-                QMessageBox.warning(self, "邀请码错误", f"邀请码验证失败: {error}")
+                self._show_warning("邀请码错误", f"邀请码验证失败: {error}")
         else:
-            QMessageBox.warning(self, "注册错误", f"注册过程中发生错误: {error}")
+            self._show_warning("注册错误", f"注册过程中发生错误: {error}")
     
     def load_saved_credentials(self):
         """加载保存的用户名和密码"""
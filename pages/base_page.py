@@ -7,6 +7,19 @@ from PyQt6.QtGui import QFont
 class BasePage(QWidget):
     """所有页面的基类"""
     
+    # 页面标题字体，所有页面共用，导入时创建一次
+    _TITLE_FONT = QFont()
+    _TITLE_FONT.setPointSize(24)
+    _TITLE_FONT.setBold(True)
+    
+    # 占位内容区域样式，所有页面共用同一字符串
+    _CONTENT_QSS = """
+        QWidget {
+            background-color: #252525;
+            border-radius: 8px;
+        }
+    """
+    
     def __init__(self, page_name):
         super().__init__()
         self.page_name = page_name
@@ -20,21 +33,13 @@ class BasePage(QWidget):
         
         # 页面标题
         title_label = QLabel(self.page_name)
-        title_font = QFont()
-        title_font.setPointSize(24)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(BasePage._TITLE_FONT)
         title_label.setStyleSheet("color: #8b5cf6; padding: 20px 0;")
         layout.addWidget(title_label)
         
         # 占位内容区域
         content_area = QWidget()
-        content_area.setStyleSheet("""
-            QWidget {
-                background-color: #252525;
-                border-radius: 8px;
-            }
-        """)
+        content_area.setStyleSheet(BasePage._CONTENT_QSS)
         content_area.setMinimumHeight(600)
         layout.addWidget(content_area)
         
@@ -1,15 +1,25 @@
 """主页"""
+import asyncio
+import functools
+import hashlib
 import json
+import math
 import os
+import sys
 import tempfile
+import time
+from collections import OrderedDict, defaultdict
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QLineEdit, QScrollArea, QGridLayout, QFrame, QStackedWidget,
     QProgressBar, QMessageBox, QSizePolicy, QSlider
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, QUrl, QMetaObject, Q_ARG, QSize
-from PyQt6.QtGui import QFont, QPixmap, QIcon, QMovie
+from PyQt6.QtCore import (
+    Qt, QTimer, pyqtSignal, QThread, QUrl, QMetaObject, Q_ARG, QSize,
+    QObject, QRunnable, QThreadPool, QSignalBlocker, QSaveFile, QIODevice
+)
+from PyQt6.QtGui import QFont, QImage, QImageReader, QPixmap, QPixmapCache, QIcon, QMovie, QPainter, QColor, QGuiApplication, QCursor
 from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
 
 from .base_page import BasePage
@@ -17,10 +27,720 @@ from api.models import models_api
 from api.async_utils import run_async
 from api.auth import auth_api
 
+# orjson 解析速度更快，未安装时回退到标准库 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# 主页/管理页共用的样式表：在页面上设置一次，控件通过动态属性匹配
+# （外层窗口的 transparent 样式会覆盖全局 style.qss 中的背景色，所以放在页面级）
+MODEL_PAGE_QSS = """
+    /* 模型卡片 */
+    QFrame[model_card=true] {
+        background-color: #252525;
+        border: 2px solid #3d3d3d;
+        border-radius: 12px;
+    }
+    QFrame[model_card=true]:hover {
+        border: 2px solid #8b5cf6;
+        background-color: #2d2d2d;
+    }
+    QLabel[card_image=true] {
+        background-color: #1e1e1e;
+        border-radius: 8px;
+        border: 1px solid #3d3d3d;
+    }
+    QLabel[card_name=true] {
+        font-size: 16px;
+        font-weight: bold;
+        padding: 5px;
+        border: none;
+        background-color: transparent;
+    }
+    QPushButton[card_detail_btn=true] {
+        background-color: #8b5cf6;
+        color: #ffffff;
+        border: none;
+        border-radius: 6px;
+        padding: 8px;
+        font-size: 13px;
+    }
+    QPushButton[card_detail_btn=true]:hover {
+        background-color: #7c3aed;
+    }
+    QPushButton[card_detail_btn=true]:pressed {
+        background-color: #6d28d9;
+    }
+
+    /* 详情页导航 */
+    QPushButton[detail_back_btn=true] {
+        border-radius: 6px;
+        padding: 8px 15px;
+        font-size: 14px;
+    }
+    QLabel[detail_breadcrumb=true] {
+        color: #8b5cf6;
+        font-size: 14px;
+    }
+
+    /* 详情页左侧面板 */
+    QWidget[detail_left_panel=true],
+    QWidget[detail_left_panel=true] QWidget[detail_info_panel=true] {
+        background-color: #25252E;
+        border-radius: 4px;
+    }
+    QLabel[detail_image=true] {
+        background-color: rgba(0, 0, 0, 0.3);
+        border-radius: 8px;
+        color: #ffffff;
+        font-size: 48px;
+    }
+    QLabel[detail_name=true] {
+        color: #ffffff;
+        font-size: 24px;
+        font-weight: bold;
+    }
+    QLabel[detail_info=true] {
+        color: #cccccc;
+        font-size: 14px;
+    }
+
+    /* 详情页信息区块，区块内控件沿用区块底色与内边距 */
+    QWidget[detail_section=true],
+    QWidget[detail_section=true] QWidget {
+        background-color: #252525;
+        border-radius: 8px;
+        padding: 20px;
+    }
+    QWidget[detail_section=true] QLabel[section_title=true] {
+        font-size: 18px;
+        font-weight: bold;
+        border: none;
+        background-color: transparent;
+        padding: 0px;
+    }
+    QWidget[detail_section=true] QLabel[section_text=true] {
+        font-size: 14px;
+        border: none;
+        background-color: transparent;
+        padding: 0px;
+    }
+    QWidget[detail_section=true] QPushButton[player_btn=true] {
+        background-color: #8b5cf6;
+        color: #ffffff;
+        border: none;
+        border-radius: 20px;
+        font-size: 16px;
+        padding: 0px;
+    }
+    QWidget[detail_section=true] QPushButton[player_btn=true]:hover {
+        background-color: #7c3aed;
+    }
+    QSlider[player_slider=true]::groove:horizontal {
+        background-color: #3d3d3d;
+        height: 4px;
+        border-radius: 2px;
+    }
+    QSlider[player_slider=true]::handle:horizontal {
+        background-color: #8b5cf6;
+        width: 12px;
+        height: 12px;
+        border-radius: 6px;
+        margin: -4px 0;
+    }
+    QSlider[player_slider=true]::handle:horizontal:hover {
+        background-color: #7c3aed;
+        width: 14px;
+        height: 14px;
+        border-radius: 7px;
+    }
+    QSlider[player_slider=true]::sub-page:horizontal {
+        background-color: #8b5cf6;
+        border-radius: 2px;
+    }
+    QLabel[player_time=true] {
+        font-size: 14px;
+    }
+    QWidget[detail_section=true] QPushButton[section_btn=true] {
+        background-color: #8b5cf6;
+        color: #ffffff;
+        border: none;
+        border-radius: 6px;
+        font-weight: bold;
+        padding: 0px;
+    }
+    QWidget[detail_section=true] QPushButton[section_btn=true]:hover {
+        background-color: #7c3aed;
+    }
+    QWidget[detail_section=true] QPushButton[download_btn=true]:disabled {
+        background-color: #555555;
+        color: #888888;
+    }
+    QPushButton[trial_btn=true] {
+        font-size: 16px;
+    }
+    QPushButton[download_btn=true] {
+        font-size: 14px;
+    }
+    QWidget[detail_section=true] QPushButton[use_btn=true] {
+        font-size: 14px;
+        padding: 10px;
+    }
+    QWidget[detail_section=true] QLabel[trial_time=true] {
+        color: #8b5cf6;
+        font-size: 16px;
+        font-weight: bold;
+        border: none;
+        background-color: transparent;
+        padding: 0px;
+    }
+    QWidget[detail_section=true] QProgressBar[download_progress=true] {
+        border: 1px solid #555555;
+        border-radius: 4px;
+        text-align: center;
+        background-color: #1a1a1a;
+        color: #ffffff;
+    }
+    QProgressBar[download_progress=true]::chunk {
+        background-color: #8b5cf6;
+        border-radius: 3px;
+    }
+    QWidget[detail_section=true] QLabel[section_hint=true] {
+        color: #888888;
+        font-size: 12px;
+        border: none;
+        background-color: transparent;
+        padding: 0px;
+    }
+    QWidget[detail_section=true] QLabel[use_path=true] {
+        padding: 5px 0px;
+    }
+    QWidget[detail_section=true] QLabel[use_status=true] {
+        color: #4caf50;
+        font-size: 14px;
+        border: none;
+        background-color: transparent;
+        padding: 0px;
+    }
+
+    /* 列表页 */
+    QScrollArea[model_scroll=true] {
+        border: none;
+    }
+    QScrollArea[model_scroll=true] QScrollBar:vertical {
+        background-color: #2d2d2d;
+        width: 8px;
+        border-radius: 6px;
+    }
+    QScrollArea[model_scroll=true] QScrollBar::handle:vertical {
+        background-color: #8b5cf6;
+        border-radius: 6px;
+        min-height: 30px;
+    }
+    QScrollArea[model_scroll=true] QScrollBar::handle:vertical:hover {
+        background-color: #7c3aed;
+    }
+    QLabel[model_loading=true] {
+        color: #8b5cf6;
+        font-size: 16px;
+        padding: 20px;
+    }
+    QLineEdit[model_search=true] {
+        background-color: #1e1e1e;
+        border: 2px solid #3d3d3d;
+        border-radius: 8px;
+        padding: 2px 15px;
+        font-size: 14px;
+    }
+    QLineEdit[model_search=true]:focus {
+        border: 2px solid #8b5cf6;
+    }
+
+    QWidget[model_toolbar=true] {
+        background-color: transparent;
+    }
+
+    /* 分类按钮：category_state 为 all / active / idle */
+    QPushButton[category_state="idle"],
+    QPushButton[category_state="active"],
+    QPushButton[category_state="all"] {
+        background-color: #2d2d2d;
+        color: #ffffff;
+        border: none;
+        border-radius: 6px;
+        padding: 8px 20px;
+        font-size: 14px;
+    }
+    QPushButton[category_state="idle"]:hover {
+        background-color: #3d3d3d;
+    }
+    QPushButton[category_state="active"] {
+        background-color: #8b5cf6;
+        font-weight: bold;
+    }
+    QPushButton[category_state="all"] {
+        background-color: #e74c3c;
+        font-weight: bold;
+    }
+"""
+
+
+# 模型压缩包不超过该大小时下载到内存直接解压，不在磁盘上写入再读回
+PACKAGE_MEMORY_LIMIT = 256 * 1024 * 1024
+
+# 模型没有介绍时使用的默认文案
+DEFAULT_MODEL_DESCRIPTION = "茶韵悠悠可音袅袅少御音介于少女与御姐之间既有少女清脆又具御姐沉稳圆润柔和年龄感适中清嗓咳嗽呢喃细语悄悄话 笑声 自带情绪感"
+
+# 试用倒计时文本（0~60 分钟），每秒直接查表，不再格式化字符串
+TRIAL_TIME_TEXTS = tuple(
+    f"剩余时间: {minutes:02d}:{seconds:02d}"
+    for minutes, seconds in (divmod(t, 60) for t in range(3601))
+)
+
+
+def set_trial_deadline(trial_data: dict) -> dict:
+    """按记录中的剩余秒数记下试用结束时刻（time.monotonic），之后再读取剩余时间不会停在记录时的值"""
+    trial_data["deadline"] = time.monotonic() + (trial_data.get("remaining_seconds") or 0)
+    return trial_data
+
+
+def trial_remaining_seconds(trial_data: dict) -> int:
+    """试用记录的当前剩余秒数：有结束时刻时按单调时钟计算，否则使用记录中的值"""
+    deadline = trial_data.get("deadline")
+    if deadline is None:
+        return trial_data.get("remaining_seconds", 0)
+    return max(0, math.ceil(deadline - time.monotonic()))
+
+
+@functools.lru_cache(maxsize=1024)
+def format_play_time(seconds: int) -> str:
+    """试听进度的时间文本（m:ss），按整秒缓存，同一秒内的多次刷新复用同一个字符串"""
+    minutes, seconds = divmod(seconds, 60)
+    return f"{minutes}:{seconds:02d}"
+
+
+# 缩放后的图片放在全局 QPixmapCache 中，上限调到 64MB（单位 KB）
+QPixmapCache.setCacheLimit(64 * 1024)
+
+
+def _scaled_cache_key(path: str, width: int, height: int):
+    """缩放图片在 QPixmapCache 中的键，带上文件修改时间，图片被替换后会重新加载；文件不存在时返回 None"""
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    return f"{path}:{mtime}:{width}x{height}"
+
+
+def read_scaled_image(path: str, width: int, height: int):
+    """读取图片并按比例缩放到 width×height 以内，返回 (QImage, 缩放比例)；读取失败时返回空 QImage
+    
+    大幅缩小时让 QImageReader 在解码阶段直接输出目标尺寸（JPEG 解码器按比例缩小 DCT，
+    不需要先分配原图大小的 QImage）；尺寸相近或放大时解码原图再缩放
+    """
+    reader = QImageReader(path)
+    size = reader.size()
+    if size.isValid() and size.width() > 0 and size.height() > 0:
+        ratio = min(width / size.width(), height / size.height())
+        if ratio < 2 / 3:
+            reader.setScaledSize(size.scaled(width, height, Qt.AspectRatioMode.KeepAspectRatio))
+            return reader.read(), ratio
+    
+    image = reader.read()
+    if image.isNull():
+        return image, 1.0
+    ratio = min(width / image.width(), height / image.height())
+    # 原图与目标尺寸相近（缩放比例在 2/3 ~ 1.5 之间）时快速缩放看不出差别，
+    # 只有大幅缩放才使用较慢的平滑缩放
+    if 2 / 3 <= ratio <= 1.5:
+        mode = Qt.TransformationMode.FastTransformation
+    else:
+        mode = Qt.TransformationMode.SmoothTransformation
+    return image.scaled(width, height, Qt.AspectRatioMode.KeepAspectRatio, mode), ratio
+
+
+def load_cached_pixmap(path: str, width: int = 0, height: int = 0) -> QPixmap:
+    """同步读取图片并放入 QPixmapCache，再次使用同一文件时不再解码
+    
+    width/height 为 0 时返回原图，否则返回按比例平滑缩放到该尺寸内的图；读取失败时返回空 QPixmap
+    """
+    key = _scaled_cache_key(path, width, height)
+    if key:
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None:
+            return pixmap
+    if width and height:
+        image, _ = read_scaled_image(path, width, height)
+        pixmap = QPixmap.fromImage(image)
+    else:
+        pixmap = QPixmap(path)
+    if key and not pixmap.isNull():
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def find_cached_pixmap(path: str, width: int = 0, height: int = 0):
+    """在 QPixmapCache 中查找图片（宽高为 0 时为原图），没有缓存或文件不存在时返回 None"""
+    key = _scaled_cache_key(path, width, height)
+    return QPixmapCache.find(key) if key else None
+
+
+def cache_loaded_image(path: str, image: QImage, width: int = 0, height: int = 0) -> QPixmap:
+    """把 ImageLoader 解码得到的 QImage 转成 QPixmap（只能在界面线程调用）并放入缓存"""
+    pixmap = QPixmap.fromImage(image)
+    key = _scaled_cache_key(path, width, height)
+    if key and not pixmap.isNull():
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+# 缩略图的磁盘缓存目录，程序重启后也不用再解码原图
+THUMBNAIL_DIR = os.path.join(tempfile.gettempdir(), "rvc_thumbs")
+
+
+def thumbnail_path(path: str, width: int, height: int):
+    """缩略图在磁盘缓存中的路径（带上原图修改时间，原图被替换后生成新文件）；原图不存在时返回 None"""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    digest = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(THUMBNAIL_DIR, f"{digest}_{mtime}_{width}x{height}.png")
+
+
+def _remove_stale_thumbnails(thumb_path: str):
+    """删除同一张原图在旧修改时间下生成的缩略图，原图被替换后磁盘缓存不会一直增长"""
+    # 文件名为 <路径哈希>_<修改时间>_<宽>x<高>.png，同一哈希下修改时间不同的都已过期
+    current = os.path.basename(thumb_path).rsplit("_", 1)[0] + "_"
+    digest = current.split("_", 1)[0] + "_"
+    try:
+        with os.scandir(THUMBNAIL_DIR) as entries:
+            for entry in entries:
+                if entry.name.startswith(digest) and not entry.name.startswith(current):
+                    try:
+                        os.remove(entry.path)
+                    except OSError:
+                        pass
+    except OSError:
+        pass
+
+
+class ImageLoaderSignals(QObject):
+    """ImageLoader 的信号（QRunnable 不是 QObject，不能直接定义信号）"""
+    finished = pyqtSignal(str, QImage)  # 图片路径, 缩放后的图片（加载失败时为空 QImage）
+
+
+class ImageLoader(QRunnable):
+    """在线程池中解码并缩放图片（宽高为 0 时解码原图）
+    
+    QPixmap 只能在界面线程中创建，这里用 QImage 解码和缩放，
+    完成后由界面线程转换成 QPixmap 并放入缓存
+    """
+    
+    def __init__(self, path: str, width: int = 0, height: int = 0):
+        super().__init__()
+        self.path = path
+        self.width = width
+        self.height = height
+        self.signals = ImageLoaderSignals()
+    
+    def run(self):
+        # 宽高为 0 时只解码原图，不缩放也不写缩略图
+        if not (self.width and self.height):
+            self.signals.finished.emit(self.path, QImage(self.path))
+            return
+        
+        # 磁盘上已有缩略图时只解码这张小图
+        thumb_path = thumbnail_path(self.path, self.width, self.height)
+        if thumb_path and os.path.exists(thumb_path):
+            image = QImage(thumb_path)
+            if not image.isNull():
+                self.signals.finished.emit(self.path, image)
+                return
+        
+        image, ratio = read_scaled_image(self.path, self.width, self.height)
+        # 原图比缩略图大时才值得写入磁盘缓存
+        if thumb_path and ratio < 1 and not image.isNull():
+            self._save_thumbnail(image, thumb_path)
+        self.signals.finished.emit(self.path, image)
+    
+    @staticmethod
+    def _save_thumbnail(image: QImage, thumb_path: str):
+        """写入缩略图缓存（QSaveFile 写完再替换，多个线程同时写同一张也不会读到半个文件）"""
+        try:
+            os.makedirs(THUMBNAIL_DIR, exist_ok=True)
+        except OSError:
+            return
+        save_file = QSaveFile(thumb_path)
+        if save_file.open(QIODevice.OpenModeFlag.WriteOnly) and image.save(save_file, "PNG"):
+            if save_file.commit():
+                _remove_stale_thumbnails(thumb_path)
+        else:
+            save_file.cancelWriting()
+
+
+# 模型图片支持的格式（同一目录有多张同名图片时按此顺序优先）
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".gif", ".webp")
+
+# 试听音频支持的格式
+AUDIO_EXTENSIONS = frozenset((".wav", ".mp3", ".flac", ".m4a", ".ogg", ".aac"))
+
+# 模型目录的试听音频索引 {根目录: {模型名称/目录名: 音频路径}}，根目录修改时间变化时重建
+_AUDIO_INDEX: dict[str, dict[str, str]] = {}
+_AUDIO_INDEX_MTIME: dict[str, float] = {}
+
+
+def _scan_model_dir(path: str):
+    """一次遍历模型目录，返回 (第一个 json 文件路径, 第一个音频文件路径)，找不到的为 None"""
+    json_file = audio_file = None
+    with os.scandir(path) as it:
+        for entry in it:
+            if not entry.is_file():
+                continue
+            ext = os.path.splitext(entry.name)[1].lower()
+            if ext == ".json":
+                if json_file is None:
+                    json_file = entry.path
+            elif ext in AUDIO_EXTENSIONS and audio_file is None:
+                audio_file = entry.path
+            if json_file and audio_file:
+                break
+    return json_file, audio_file
+
+
+def _find_model_image(file_dir: str, stem: str) -> str:
+    """一次遍历目录查找模型图片：优先与模型文件同名的图片，其次目录下第一张图片；找不到返回空字符串"""
+    named = {}
+    first_image = ""
+    try:
+        with os.scandir(file_dir) as it:
+            for entry in it:
+                name_stem, ext = os.path.splitext(entry.name)
+                # 扩展名不区分大小写（<stem>.PNG 也算同名图片），跳过图片名的子目录
+                ext = ext.lower()
+                if ext not in IMAGE_EXTENSIONS or not entry.is_file():
+                    continue
+                if name_stem == stem:
+                    named.setdefault(ext, entry.path)
+                elif not first_image:
+                    first_image = entry.path
+    except OSError:
+        return ""
+    for ext in IMAGE_EXTENSIONS:
+        if ext in named:
+            return named[ext]
+    return first_image
+
+
+# 模型信息 json 的解析结果缓存 {路径: (修改时间, 解析结果)}
+_JSON_CACHE: dict[str, tuple[float, object]] = {}
+
+
+def load_json_cached(path: str):
+    """读取 json 文件，文件修改时间不变时直接返回上次的解析结果（调用方不要修改返回值）"""
+    mtime = os.stat(path).st_mtime
+    cached = _JSON_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with open(path, 'rb') as f:
+        raw = f.read()
+    data = orjson.loads(raw) if orjson else json.loads(raw)
+    _JSON_CACHE[path] = (mtime, data)
+    return data
+
+
+def _iter_model_dirs(root: str):
+    """遍历根目录下的模型目录，逐个返回 (目录项, json 信息, 第一个音频文件路径)
+    
+    音频索引和本地模型 uid 扫描共用这段遍历逻辑，json 读取失败时信息为空字典
+    """
+    with os.scandir(root) as it:
+        for entry in it:
+            if not entry.is_dir():
+                continue
+            json_file, audio_file = _scan_model_dir(entry.path)
+            model_info = {}
+            if json_file:
+                try:
+                    model_info = load_json_cached(json_file)
+                except Exception as e:
+                    print(f"读取本地模型信息文件失败 {json_file}: {e}")
+                if not isinstance(model_info, dict):
+                    model_info = {}
+            yield entry, model_info, audio_file
+
+
+def _build_audio_index(root: str) -> dict[str, str]:
+    """按 json 中的 name 和目录名索引每个模型目录的第一个音频文件"""
+    index = {}
+    for entry, model_info, audio_path in _iter_model_dirs(root):
+        if audio_path:
+            index.setdefault(model_info.get("name", entry.name), audio_path)
+            index.setdefault(entry.name, audio_path)
+    return index
+
+
+def find_indexed_audio(root: str, model_name: str):
+    """在根目录的音频索引中查找模型的试听音频，找不到返回 None"""
+    try:
+        mtime = os.stat(root).st_mtime
+    except OSError:
+        return None
+    if _AUDIO_INDEX_MTIME.get(root) != mtime:
+        # 索引需要重建时，先看是否有与模型同名的目录：有音频就直接返回，不用读取所有模型的 json
+        if model_name and os.path.basename(model_name) == model_name and model_name not in (".", ".."):
+            try:
+                audio_path = _scan_model_dir(os.path.join(root, model_name))[1]
+            except OSError:
+                audio_path = None
+            if audio_path:
+                return audio_path
+        _AUDIO_INDEX[root] = _build_audio_index(root)
+        _AUDIO_INDEX_MTIME[root] = mtime
+    return _AUDIO_INDEX[root].get(model_name)
+
+
+def extract_model_package(source, dest: str):
+    """解压模型压缩包到 dest，返回 (是否成功, 失败信息)；在线程池中调用，不占用下载协程的事件循环
+    
+    source 为压缩包路径，或下载到内存的 BytesIO（只在 py7zr 可用时出现）
+    """
+    try:
+        import py7zr
+    except ImportError:
+        py7zr = None
+    
+    if py7zr is not None:
+        try:
+            with py7zr.SevenZipFile(source, mode='r') as archive:
+                archive.extractall(path=dest)
+        except Exception as e:
+            return False, f"解压失败: {str(e)}"
+        return True, ""
+    
+    # 如果没有py7zr，尝试使用7z命令行工具
+    import subprocess
+    result = subprocess.run(
+        ['7z', 'x', source, f'-o{dest}', '-y'],
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        return False, f"解压失败: {result.stderr}"
+    return True, ""
+
+
+def invalidate_audio_index():
+    """模型下载解压后调用：已有模型目录里新增的文件不会改变根目录修改时间，需要强制重建索引"""
+    _AUDIO_INDEX_MTIME.clear()
+
+
+# 播放器信号槽中比较的状态值，模块加载时取一次
+END_OF_MEDIA = QMediaPlayer.MediaStatus.EndOfMedia
+PLAYBACK_STOPPED = QMediaPlayer.PlaybackState.StoppedState
+
+
+class PreviewPlayer(QMediaPlayer):
+    """所有详情页共用的试听播放器，哪个详情页播放就把信号接到哪个页面"""
+    
+    def __init__(self):
+        super().__init__()
+        self.audio_output = QAudioOutput(self)
+        self.setAudioOutput(self.audio_output)
+        self.owner = None  # 当前使用播放器的详情页
+        self.source_path = None  # 当前加载的音频文件路径
+    
+    def set_source_path(self, path):
+        """加载音频文件，与当前文件相同时不重新设置 source"""
+        if path != self.source_path:
+            self.setSource(QUrl.fromLocalFile(path))
+            self.source_path = path
+    
+    def attach(self, page):
+        """把播放器交给 page 使用，之前的页面停止播放并复位播放控件"""
+        if self.owner is page:
+            return
+        if self.owner is not None:
+            self.release(self.owner)
+        self.mediaStatusChanged.connect(page.on_media_status_changed)
+        self.positionChanged.connect(page.on_position_changed)
+        self.durationChanged.connect(page.on_duration_changed)
+        self.playbackStateChanged.connect(page.on_playback_state_changed)
+        self.owner = page
+    
+    def release(self, page):
+        """page 不再使用播放器（切走或离开详情页）：停止播放、断开信号并复位它的播放控件"""
+        if self.owner is not page:
+            return
+        self.stop()
+        self.mediaStatusChanged.disconnect()
+        self.positionChanged.disconnect()
+        self.durationChanged.disconnect()
+        self.playbackStateChanged.disconnect()
+        self.owner = None
+        page.on_player_released()
+
+
+@functools.lru_cache(maxsize=None)
+def preview_player() -> PreviewPlayer:
+    """获取共用的试听播放器，第一次播放时才创建"""
+    return PreviewPlayer()
+
+
+@functools.lru_cache(maxsize=None)
+def hand_cursor() -> QCursor:
+    """卡片、分类和详情页按钮共用的手型光标，只创建一次"""
+    return QCursor(Qt.CursorShape.PointingHandCursor)
+
+
+@functools.lru_cache(maxsize=None)
+def glyph_icon(ch: str, size: int = 16, color: str = "#ffffff") -> QIcon:
+    """把按钮上的符号（▶、⏸、← 等）预先绘制成图标，每种符号只绘制一次"""
+    ratio = QGuiApplication.instance().devicePixelRatio()
+    pixmap = QPixmap(int(size * ratio), int(size * ratio))
+    pixmap.setDevicePixelRatio(ratio)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+    font = QFont()
+    font.setPixelSize(size - 2)
+    painter.setFont(font)
+    painter.setPen(QColor(color))
+    painter.drawText(0, 0, size, size, Qt.AlignmentFlag.AlignCenter, ch)
+    painter.end()
+    return QIcon(pixmap)
+
+
+# 卡片占位图按 (首字符, 边长, 字号) 缓存，同一字符同一尺寸只绘制一次；
+# 模型名首字符种类可能很多（中文），缓存设上限，最久未用的占位图先淘汰
+@functools.lru_cache(maxsize=256)
+def get_placeholder(ch: str, size: int = 180, font_size: int = 48) -> QPixmap:
+    """获取卡片占位图（紫色大号首字符），代替富文本标签，避免每张卡片排版一次 HTML"""
+    ratio = QGuiApplication.instance().devicePixelRatio()
+    pixmap = QPixmap(int(size * ratio), int(size * ratio))
+    pixmap.setDevicePixelRatio(ratio)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    
+    # 背景由卡片图片标签的样式绘制，这里只画字符
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+    font = QFont()
+    font.setPixelSize(font_size)
+    painter.setFont(font)
+    painter.setPen(QColor("#8b5cf6"))
+    painter.drawText(0, 0, size, size, Qt.AlignmentFlag.AlignCenter, ch)
+    painter.end()
+    return pixmap
+
 
 class ModelCard(QFrame):
     """模型卡片组件"""
     detail_clicked = pyqtSignal(str)  # 发送模型ID
+    CARD_WIDTH = 200
+    CARD_HEIGHT = 280
     
     def __init__(self, model_data, parent=None, load_online=False):
         super().__init__(parent)
@@ -36,25 +756,15 @@ class ModelCard(QFrame):
         self.image_download_worker = None
         
         # 保存图片对象引用，用于传递给详情页
-        self.original_pixmap = None  # 静态图片的原始 pixmap
         self.movie = None  # GIF 动图的 movie 对象
+        self.has_placeholder = False  # 当前显示的是占位图（不传递给详情页）
         
         self.setup_ui()
     
     def setup_ui(self):
         """设置UI"""
-        self.setFixedSize(200, 280)
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #252525;
-                border: 2px solid #3d3d3d;
-                border-radius: 12px;
-            }
-            QFrame:hover {
-                border: 2px solid #8b5cf6;
-                background-color: #2d2d2d;
-            }
-        """)
+        self.setFixedSize(self.CARD_WIDTH, self.CARD_HEIGHT)
+        self.setProperty("model_card", True)
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(10, 10, 10, 10)
@@ -64,111 +774,124 @@ class ModelCard(QFrame):
         image_label = QLabel()
         image_label.setFixedSize(180, 180)
         image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        image_label.setStyleSheet("""
-            QLabel {
-                background-color: #1e1e1e;
-                border-radius: 8px;
-                border: 1px solid #3d3d3d;
-            }
-        """)
+        image_label.setProperty("card_image", True)
         
         # 保存 image_label 引用，用于后续更新
         self.image_label = image_label
-        
-        # 根据 load_online 标志决定加载方式
-        if self.load_online:
-            # 主页使用：优先从服务端下载图片
-            self._load_online_image()
-        else:
-            # 管理页面使用：读取本地路径
-            self._load_local_image()
-        
-        image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._load_image()
         layout.addWidget(image_label)
         
         # 名称
         name_label = QLabel(self.model_name)
         name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        # 基础样式由全局样式表提供，只设置特殊样式
-        name_label.setStyleSheet("font-size: 16px; font-weight: bold; padding: 5px; border: none; background-color: transparent;")
+        name_label.setProperty("card_name", True)
+        self.name_label = name_label
         layout.addWidget(name_label)
         
         # 详情按钮
         detail_btn = QPushButton("音色详情")
-        detail_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #8b5cf6;
-                color: #ffffff;
-                border: none;
-                border-radius: 6px;
-                padding: 8px;
-                font-size: 13px;
-            }
-            QPushButton:hover {
-                background-color: #7c3aed;
-            }
-            QPushButton:pressed {
-                background-color: #6d28d9;
-            }
-        """)
-        detail_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        detail_btn.clicked.connect(lambda: self.detail_clicked.emit(self.model_id))
+        detail_btn.setProperty("card_detail_btn", True)
+        detail_btn.setCursor(hand_cursor())
+        # 界面线程内的信号都使用直接连接，跳过自动连接的线程判断
+        detail_btn.clicked.connect(self._on_detail_btn_clicked, Qt.ConnectionType.DirectConnection)
         layout.addWidget(detail_btn)
         
         layout.addStretch()
     
+    def _on_detail_btn_clicked(self):
+        """详情按钮点击"""
+        self.detail_clicked.emit(self.model_id)
+    
+    def set_model(self, model_data):
+        """复用卡片显示另一个模型（卡片池回收后调用）"""
+        self.cleanup()
+        if self.movie:
+            self.movie.stop()
+        self.movie = None
+        
+        self.model_id = model_data.get("id", "")
+        self.model_name = model_data.get("name", "未知")
+        self.model_image = model_data.get("image", "")
+        self.model_category = model_data.get("category", "全部")
+        self.model_data = model_data
+        
+        self.name_label.setText(self.model_name)
+        self.image_label.clear()
+        self._load_image()
+    
+    def _load_image(self):
+        """根据 load_online 标志决定加载方式"""
+        if self.load_online:
+            # 主页使用：优先从服务端下载图片
+            self._load_online_image()
+        else:
+            # 管理页面使用：读取本地路径
+            self._load_local_image()
+    
+    def _show_placeholder(self):
+        """根据名称首字符显示占位图"""
+        self.has_placeholder = True
+        self.image_label.setPixmap(get_placeholder(self.model_name[0] if self.model_name else "?"))
+    
     def _load_local_image(self):
-        """加载本地图片（管理页面使用）"""
-        if self.model_image and os.path.exists(self.model_image):
+        """加载本地图片（管理页面使用）；图片不存在或无法加载时显示占位符并返回 False
+        
+        不再单独 os.path.exists：静态图取缓存键时读取修改时间、GIF 由 QMovie.isValid() 判断文件是否可用
+        """
+        self.has_placeholder = False
+        if self.model_image:
             try:
                 # 检查是否为 GIF 动图
                 file_ext = os.path.splitext(self.model_image)[1].lower()
                 if file_ext == '.gif':
                     # 使用 QMovie 加载 GIF 动图
                     movie = QMovie(self.model_image)
-                    movie.setScaledSize(self.image_label.size())
-                    self.image_label.setMovie(movie)
-                    movie.start()
-                    # 保存 movie 引用，防止被垃圾回收
-                    self.movie = movie
+                    if movie.isValid():
+                        movie.setScaledSize(self.image_label.size())
+                        self.image_label.setMovie(movie)
+                        movie.start()
+                        # 保存 movie 引用，防止被垃圾回收
+                        self.movie = movie
+                        return True
                 elif file_ext == '.png' or file_ext == '.jpg' or file_ext == '.jpeg' or file_ext == '.bmp' or file_ext == '.webp':
-                    # 使用 QPixmap 加载静态图片（PNG、JPG等）
-                    pixmap = QPixmap(self.model_image)
-                    if not pixmap.isNull():
-                        # 保存原始 pixmap，用于传递给详情页
-                        self.original_pixmap = pixmap
-                        # 缩放图片以适应标签大小，保持宽高比
-                        scaled_pixmap = pixmap.scaled(
-                            180, 180, 
-                            Qt.AspectRatioMode.KeepAspectRatio, 
-                            Qt.TransformationMode.SmoothTransformation
-                        )
-                        self.image_label.setPixmap(scaled_pixmap)
-                else:
-                    # 图片加载失败，显示占位符
-                    placeholder = self.model_name[0] if self.model_name else "?"
-                    self.image_label.setText(f"<div style='font-size: 48px; color: #8b5cf6;'>{placeholder}</div>")
+                    # 静态图片（PNG、JPG等）使用缓存的缩略图，详情页需要原图时再按路径加载
+                    # 取不到缓存键（修改时间）说明文件不存在
+                    key = _scaled_cache_key(self.model_image, 180, 180)
+                    if key:
+                        pixmap = QPixmapCache.find(key)
+                        if pixmap is not None:
+                            self.image_label.setPixmap(pixmap)
+                        else:
+                            # 缓存未命中时到线程池中解码，避免逐张卡片阻塞界面线程
+                            loader = ImageLoader(self.model_image, 180, 180)
+                            loader.signals.finished.connect(self._on_thumb_loaded)
+                            QThreadPool.globalInstance().start(loader)
+                        return True
             except Exception as e:
                 # 图片加载出错，显示占位符
                 print(f"加载图片失败 {self.model_image}: {e}")
-                placeholder = self.model_name[0] if self.model_name else "?"
-                self.image_label.setText(f"<div style='font-size: 48px; color: #8b5cf6;'>{placeholder}</div>")
-        else:
-            # 根据名称生成占位符
-            placeholder = self.model_name[0] if self.model_name else "?"
-            self.image_label.setText(f"<div style='font-size: 48px; color: #8b5cf6;'>{placeholder}</div>")
+        # 没有图片、文件不存在或格式不支持：根据名称生成占位符
+        self._show_placeholder()
+        return False
+    
+    def _on_thumb_loaded(self, path, image):
+        """线程池中的缩略图解码完成"""
+        if image.isNull():
+            return
+        pixmap = QPixmap.fromImage(image)
+        key = _scaled_cache_key(path, 180, 180)
+        if key:
+            QPixmapCache.insert(key, pixmap)
+        # 卡片可能已被复用显示其他模型
+        if path == self.model_image and not self.movie:
+            self.image_label.setPixmap(pixmap)
     
     def _load_online_image(self):
         """从服务端下载并显示图片（主页使用，优先从服务端获取）"""
-        # 先尝试加载本地图片（如果存在）
-        if self.model_image and os.path.exists(self.model_image):
-            self._load_local_image()
+        # 先尝试加载本地图片（如果存在）；不存在时已显示占位符
+        if self._load_local_image():
             return  # 本地图片存在，直接使用
         
-        # 显示占位符
-        placeholder = self.model_name[0] if self.model_name else "?"
-        self.image_label.setText(f"<div style='font-size: 48px; color: #8b5cf6;'>{placeholder}</div>")
-        
         # 获取模型UUID
         model_uid = self.model_data.get("uid")
         if not model_uid:
@@ -260,10 +983,12 @@ class ModelDetailPage(QWidget):
         self.is_purchased = is_purchased  # 是否已购买/已下载
         self.home_page = home_page  # 主页引用，用于更新本地模型uid列表
         self.main_window = main_window  # 主窗口引用，用于刷新管理页面
-        self.model_image = model_image  # 模型图片（QPixmap 或 QMovie），由调用者传递
+        self.model_image = model_image  # 模型图片（QPixmap、QMovie 或静态图片路径），由调用者传递
         self.trial_timer = QTimer()
+        # 秒级倒计时不需要精确定时，使用粗粒度定时器减少唤醒
+        self.trial_timer.setTimerType(Qt.TimerType.CoarseTimer)
         self.trial_timer.timeout.connect(self.update_trial_time)
-        self.trial_seconds = 0
+        self.trial_end_time = 0.0  # 试用结束时刻（time.monotonic），剩余时间每次按它计算
         self.trial_active = False
         
         # 试用线程相关
@@ -276,14 +1001,23 @@ class ModelDetailPage(QWidget):
         self.trial_sync_timer = None  # 定期同步服务器状态的定时器
         
         # 音频播放相关
-        self.audio_player = None
-        self.audio_output = None
+        self.audio_player = None  # 共用的试听播放器，播放时从 preview_player() 获取
         self.audio_file_path = None
+        self.audio_file_searched = False  # 音频文件在第一次点击播放时才查找
         self.is_playing = False
         self.play_btn = None
+        self.play_glyph = "▶"  # 播放按钮当前显示的符号
         self.time_label = None
         self.progress_slider = None
         self.is_slider_dragging = False  # 标记是否正在拖拽滑块
+        # 后端上报播放位置很频繁，只记下最新位置，由单次定时器每 250ms 合并刷新一次进度显示
+        self.pending_position = 0
+        self.duration_ms = 0  # 时间标签后半段对应的总时长
+        self.duration_text = ""  # 总时长部分（" / m:ss"），只在总时长变化时格式化
+        self.position_timer = QTimer(self)
+        self.position_timer.setSingleShot(True)
+        self.position_timer.setInterval(250)
+        self.position_timer.timeout.connect(self._flush_position)
         
         # 下载线程相关
         self.download_thread = None
@@ -292,6 +1026,8 @@ class ModelDetailPage(QWidget):
         # 保存下载区块和使用区块的引用，用于动态切换
         self.download_section = None
         self.use_section = None
+        self.use_path_label = None  # 使用区块中的模型文件路径
+        self._action_mode = None  # 当前动作区块："use" 只有使用区块，"purchase" 为试用/下载区块
         self.right_panel = None  # 保存右侧面板的引用，用于动态添加下载区块
         
         # 音频下载相关
@@ -299,8 +1035,8 @@ class ModelDetailPage(QWidget):
         self.audio_download_thread = None
         self.audio_download_worker = None
         
-        # 查找音频文件
-        self.find_audio_file()
+        # 下载进度信号只连接一次（页面会被复用）
+        self.progress_updated.connect(self._update_download_progress)
         
         self.setup_ui()
         
@@ -309,6 +1045,83 @@ class ModelDetailPage(QWidget):
     
     def on_back_clicked(self):
         """返回按钮点击"""
+        self._stop_background_tasks()
+        # 离开详情页时交还共用播放器，隐藏的页面不再接收播放进度
+        if self.audio_player:
+            self.audio_player.release(self)
+        self.back_clicked.emit()
+    
+    def set_model(self, model_data, is_purchased=False, model_image=None):
+        """切换显示的模型：复用已创建的控件，只更新数据并重建随模型变化的区块"""
+        # 停止上一个模型的线程、定时器和播放
+        self._stop_background_tasks()
+        if self.audio_player:
+            self.audio_player.stop()
+        self._reset_player_controls()
+        if self.movie:
+            self.movie.stop()
+        
+        # 前后两个模型都只显示使用区块时，区块可以直接复用
+        reuse_use_section = is_purchased and self._action_mode == "use"
+        
+        # 更新数据和状态
+        self.model_data = model_data
+        self.is_purchased = is_purchased
+        self.model_image = model_image
+        self.trial_end_time = 0.0
+        self.trial_active = False
+        self.audio_file_path = None
+        self.need_download_audio = False
+        self.audio_file_searched = False
+        
+        # 左侧面板
+        self._load_detail_image(self.image_label)
+        self.name_label.setText(self.model_data.get("name", "未知"))
+        self.info_text.setText(self._format_info_text())
+        
+        # 右侧面板：介绍和试听复用，试用/下载/使用区块按新模型重建
+        self.intro_label.setText(self.model_data.get("description", DEFAULT_MODEL_DESCRIPTION))
+        if reuse_use_section:
+            self._update_use_path()
+        else:
+            self._clear_action_sections()
+            self._build_action_sections()
+        
+        QTimer.singleShot(100, self._check_trial_status)
+    
+    def reopen(self):
+        """再次打开同一个模型：图片和介绍保留，重新检查试用状态
+
+        离开页面时已停止后台任务，被中断的下载、试用启动和音频下载会把按钮留在
+        “下载中...”“启动中...”等状态，这里恢复播放控件并重建试用/下载/使用区块。
+        """
+        self._reset_player_controls()
+        if self._action_mode != "use":
+            self._clear_action_sections()
+            self._build_action_sections()
+        QTimer.singleShot(100, self._check_trial_status)
+    
+    def _reset_player_controls(self):
+        """播放控件恢复到未播放状态"""
+        self.is_playing = False
+        self.is_slider_dragging = False
+        self.position_timer.stop()
+        if self.play_btn:
+            self.play_btn.setEnabled(True)
+            self._set_play_glyph("▶")
+        if self.progress_slider:
+            with QSignalBlocker(self.progress_slider):
+                self.progress_slider.setValue(0)
+        if self.time_label:
+            self.time_label.setText("0:00 / 0:00")
+    
+    def on_player_released(self):
+        """共用播放器被另一个详情页拿走，或离开详情页时交还"""
+        self.audio_player = None
+        self._reset_player_controls()
+    
+    def _stop_background_tasks(self):
+        """停止所有后台线程和定时器"""
         # 清理所有线程
         self._cleanup_download_thread()
         self._cleanup_audio_download_thread()
@@ -321,7 +1134,6 @@ class ModelDetailPage(QWidget):
             self.trial_sync_timer = None
         if hasattr(self, 'trial_timer') and self.trial_timer:
             self.trial_timer.stop()
-        self.back_clicked.emit()
     
     def _cleanup_download_thread(self):
         """清理下载线程资源"""
@@ -404,21 +1216,14 @@ class ModelDetailPage(QWidget):
         # 面包屑导航和返回按钮
         nav_layout = QHBoxLayout()
         
-        back_btn = QPushButton("← 返回")
-        # 基础样式由全局样式表提供，只设置特殊样式
-        back_btn.setStyleSheet("""
-            QPushButton {
-                border-radius: 6px;
-                padding: 8px 15px;
-                font-size: 14px;
-            }
-        """)
-        back_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        back_btn.clicked.connect(self.on_back_clicked)
+        back_btn = QPushButton(glyph_icon("←"), "返回")
+        back_btn.setProperty("detail_back_btn", True)
+        back_btn.setCursor(hand_cursor())
+        back_btn.clicked.connect(self.on_back_clicked, Qt.ConnectionType.DirectConnection)
         nav_layout.addWidget(back_btn)
         
         breadcrumb = QLabel(f"首页 / 音色详情")
-        breadcrumb.setStyleSheet("color: #8b5cf6; font-size: 14px;")
+        breadcrumb.setProperty("detail_breadcrumb", True)
         nav_layout.addWidget(breadcrumb)
         nav_layout.addStretch()
         
@@ -443,7 +1248,9 @@ class ModelDetailPage(QWidget):
     def create_left_panel(self):
         """创建左侧面板"""
         panel = QWidget()
-        panel.setStyleSheet("background-color: #25252E; border-radius: 4px;")
+        panel.setProperty("detail_left_panel", True)
+        # 背景由样式表绘制，显式开启样式背景
+        panel.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         layout = QVBoxLayout(panel)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
@@ -451,21 +1258,90 @@ class ModelDetailPage(QWidget):
         # 显示模型图片
         image_label = QLabel()
         image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        image_label.setStyleSheet("""
-            QLabel {
-                background-color: rgba(0, 0, 0, 0.3);
-                border-radius: 8px;
-                color: #ffffff;
-                font-size: 48px;
-            }
-        """)
+        image_label.setProperty("detail_image", True)
         image_label.setScaledContents(False)  # 不使用自动缩放，手动控制以保持宽高比
         
+        self._load_detail_image(image_label)
+        
+        # 保存image_label引用，用于resize时更新
+        self.image_label = image_label
+        
+        # 重写resizeEvent以在窗口大小改变时更新图片
+        original_resize = image_label.resizeEvent
+        def resizeEvent(event):
+            if self.is_gif and self.movie:
+                # GIF 动图：更新 movie 的缩放大小，保持宽高比
+                self._update_movie_display(image_label)
+            elif hasattr(self, 'original_pixmap') and self.original_pixmap and not self.original_pixmap.isNull():
+                # 静态图片：更新显示
+                self._update_image_display(image_label)
+            original_resize(event)
+        image_label.resizeEvent = resizeEvent
+        
+        layout.addWidget(image_label, 4)
+        
+        # 底部信息面板
+        info_panel = QWidget()
+        info_panel.setProperty("detail_info_panel", True)
+        info_layout = QVBoxLayout(info_panel)
+        info_layout.setContentsMargins(20, 20, 20, 20)
+        info_layout.setSpacing(15)
+        
+        # 模型名称
+        name_label = QLabel(self.model_data.get("name", "未知"))
+        name_label.setProperty("detail_name", True)
+        self.name_label = name_label
+        info_layout.addWidget(name_label)
+        
+        # 信息行（直接放进信息面板布局，不再套一层水平布局）
+        info_text = QLabel(self._format_info_text())
+        info_text.setProperty("detail_info", True)
+        self.info_text = info_text
+        info_layout.addWidget(info_text)
+        
+        layout.addWidget(info_panel, 1)
+        
+        return panel
+    
+    def _format_info_text(self):
+        """生成左侧信息面板文本"""
+        category = self.model_data.get("category", "")
+        category_name = self.model_data.get("category_name", "")
+        if not category_name and category:
+            # 如果没有category_name，从category字段判断
+            categories = [cat.strip() for cat in category.split(";")]
+            if "官方音色" in categories:
+                category_name = "官方音色"
+            elif "免费音色" in categories:
+                category_name = "免费音色"
+            else:
+                category_name = category.split(";")[0].strip() if category else "未知"
+        
+        price = self.model_data.get("price", 0.0)
+        if not isinstance(price, (int, float)):
+            try:
+                price = float(price)
+            except (ValueError, TypeError):
+                price = 0.0
+        
+        version = self.model_data.get("version", "V1")
+        sample_rate = self.model_data.get("sample_rate", "48K")
+        
+        return f"""
+种类: {category_name}<br>
+价格: {price}<br>
+版本: {version}<br>
+采样率: {sample_rate}
+        """
+    
+    def _load_detail_image(self, image_label):
+        """加载模型图片到详情大图标签"""
         # 保存原始pixmap或movie，用于在resize时重新缩放
         self.original_pixmap = None
         self.movie = None
         self.is_gif = False
         self.movie_original_size = None  # 保存 QMovie 的原始尺寸
+        self._detail_image_path = None  # 正在线程池中解码的详情大图
         
         # 加载模型图片：优先使用调用者传递的图片对象
         if self.model_image:
@@ -522,6 +1398,10 @@ class ModelDetailPage(QWidget):
                 self.original_pixmap = self.model_image
                 # 初始设置图片
                 self._update_image_display(image_label)
+            # 如果传递的是静态图片的路径
+            elif isinstance(self.model_image, str):
+                # 文件是否存在由 _load_detail_pixmap 取缓存键时一并判断
+                self._load_detail_pixmap(self.model_image, image_label)
             else:
                 # 图片对象无效，显示占位符
                 image_label.setText("🖼️")
@@ -550,15 +1430,8 @@ class ModelDetailPage(QWidget):
                         # 设置 GIF 动图大小策略，保持宽高比
                         self._update_movie_display(image_label)
                     elif file_ext == '.png' or file_ext == '.jpg' or file_ext == '.jpeg' or file_ext == '.bmp' or file_ext == '.webp':
-                        # 使用 QPixmap 加载静态图片（PNG、JPG等）
-                        self.is_gif = False
-                        pixmap = QPixmap(model_image_path)
-                        if not pixmap.isNull():
-                            self.original_pixmap = pixmap
-                            # 初始设置图片
-                            self._update_image_display(image_label)
-                        else:
-                            image_label.setText("🖼️")
+                        # 静态图片（PNG、JPG等）
+                        self._load_detail_pixmap(model_image_path, image_label)
                     else:
                         # 图片加载失败，显示占位符
                         image_label.setText("🖼️")
@@ -569,75 +1442,43 @@ class ModelDetailPage(QWidget):
             else:
                 # 没有图片，显示占位符
                 image_label.setText("🖼️")
+    
+    def _load_detail_pixmap(self, path, image_label):
+        """加载静态详情大图：缓存中有原图时直接显示，否则到线程池中解码，不阻塞界面线程"""
+        self.is_gif = False
+        key = _scaled_cache_key(path, 0, 0)
+        if key is None:
+            # 取不到修改时间说明文件不存在，显示占位符
+            image_label.setText("🖼️")
+            return
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None:
+            self.original_pixmap = pixmap
+            self._update_image_display(image_label)
+            return
         
-        # 保存image_label引用，用于resize时更新
-        self.image_label = image_label
-        
-        # 重写resizeEvent以在窗口大小改变时更新图片
-        original_resize = image_label.resizeEvent
-        def resizeEvent(event):
-            if self.is_gif and self.movie:
-                # GIF 动图：更新 movie 的缩放大小，保持宽高比
-                self._update_movie_display(image_label)
-            elif hasattr(self, 'original_pixmap') and self.original_pixmap and not self.original_pixmap.isNull():
-                # 静态图片：更新显示
-                self._update_image_display(image_label)
-            original_resize(event)
-        image_label.resizeEvent = resizeEvent
-        
-        layout.addWidget(image_label, 4)
-        
-        # 底部信息面板
-        info_panel = QWidget()
-        info_layout = QVBoxLayout(info_panel)
-        info_layout.setContentsMargins(20, 20, 20, 20)
-        info_layout.setSpacing(15)
-        
-        # 模型名称
-        name_label = QLabel(self.model_data.get("name", "未知"))
-        name_label.setStyleSheet("color: #ffffff; font-size: 24px; font-weight: bold;")
-        info_layout.addWidget(name_label)
-        
-        # 信息行
-        info_row = QHBoxLayout()
-        
-        # 获取模型信息
-        category = self.model_data.get("category", "")
-        category_name = self.model_data.get("category_name", "")
-        if not category_name and category:
-            # 如果没有category_name，从category字段判断
-            categories = [cat.strip() for cat in category.split(";")]
-            if "官方音色" in categories:
-                category_name = "官方音色"
-            elif "免费音色" in categories:
-                category_name = "免费音色"
-            else:
-                category_name = category.split(";")[0].strip() if category else "未知"
-        
-        price = self.model_data.get("price", 0.0)
-        if not isinstance(price, (int, float)):
-            try:
-                price = float(price)
-            except (ValueError, TypeError):
-                price = 0.0
-        
-        version = self.model_data.get("version", "V1")
-        sample_rate = self.model_data.get("sample_rate", "48K")
-        
-        info_text = QLabel(f"""
-种类: {category_name}<br>
-价格: {price}<br>
-版本: {version}<br>
-采样率: {sample_rate}
-        """)
-        info_text.setStyleSheet("color: #cccccc; font-size: 14px;")
-        info_row.addWidget(info_text)
-        info_row.addStretch()
-        info_layout.addLayout(info_row)
-        
-        layout.addWidget(info_panel, 1)
-        
-        return panel
+        image_label.clear()
+        self._detail_image_path = path
+        self._detail_image_label = image_label
+        loader = ImageLoader(path)
+        loader.signals.finished.connect(self._on_detail_image_loaded)
+        QThreadPool.globalInstance().start(loader)
+    
+    def _on_detail_image_loaded(self, path, image):
+        """线程池中的详情大图解码完成"""
+        # 解码期间可能已经切换到其他模型
+        if path != self._detail_image_path:
+            return
+        self._detail_image_path = None
+        if image.isNull():
+            self._detail_image_label.setText("🖼️")
+            return
+        pixmap = QPixmap.fromImage(image)
+        key = _scaled_cache_key(path, 0, 0)
+        if key:
+            QPixmapCache.insert(key, pixmap)
+        self.original_pixmap = pixmap
+        self._update_image_display(self._detail_image_label)
     
     def _update_image_display(self, image_label):
         """更新图片显示，保持原始宽高比"""
@@ -708,19 +1549,47 @@ class ModelDetailPage(QWidget):
         layout.setSpacing(20)
         
         # 音色介绍
-        intro_section = self.create_section("音色介绍", self.model_data.get("description", "茶韵悠悠可音袅袅少御音介于少女与御姐之间既有少女清脆又具御姐沉稳圆润柔和年龄感适中清嗓咳嗽呢喃细语悄悄话 笑声 自带情绪感"))
+        intro_section, self.intro_label = self.create_section("音色介绍", self.model_data.get("description", DEFAULT_MODEL_DESCRIPTION))
         layout.addWidget(intro_section, 4)
         
         # 试听
         audition_section = self.create_audition_section()
         layout.addWidget(audition_section, 3)
         
+        layout.addStretch()
+        
+        # 试用/下载/使用区块（随模型变化）
+        self._build_action_sections()
+        return panel
+    
+    def _insert_action_section(self, section, stretch):
+        """在右侧面板末尾的弹性空间之前插入区块"""
+        layout = self.right_panel.layout()
+        layout.insertWidget(layout.count() - 1, section, stretch)
+    
+    def _clear_action_sections(self):
+        """移除试用/下载/使用区块（介绍、试听和末尾弹性空间保留）"""
+        layout = self.right_panel.layout()
+        while layout.count() > 3:
+            item = layout.takeAt(2)
+            if item.widget():
+                item.widget().deleteLater()
+        self.trial_btn = None
+        self.trial_time_label = None
+        self.download_section = None
+        self.use_section = None
+        self._action_mode = None
+    
+    def _build_action_sections(self):
+        """根据模型状态创建试用/下载/使用区块"""
         # 如果已购买/已下载，不显示试用区块，显示使用按钮
         if self.is_purchased:
             # 使用按钮（已下载，直接使用）
             self.use_section = self.create_use_section()
-            layout.addWidget(self.use_section, 5)
+            self._insert_action_section(self.use_section, 5)
+            self._action_mode = "use"
         else:
+            self._action_mode = "purchase"
             # 检查是否为免费模型
             category = self.model_data.get("category", "")
             price = self.model_data.get("price", 0) or 0
@@ -749,7 +1618,7 @@ class ModelDetailPage(QWidget):
                 if model_uid:
                     trial_data = self.home_page.user_trials.get(model_uid)
                     if trial_data and trial_data.get("is_active", False):
-                        remaining_seconds = trial_data.get("remaining_seconds", 0)
+                        remaining_seconds = trial_remaining_seconds(trial_data)
                         if remaining_seconds > 0:
                             has_active_trial = True
             
@@ -757,63 +1626,50 @@ class ModelDetailPage(QWidget):
             if is_official_model and is_in_available_list:
                 # 显示下载区块，不显示试用区块
                 self.download_section = self.create_download_section()
-                layout.addWidget(self.download_section, 5)
+                self._insert_action_section(self.download_section, 5)
             else:
                 # 如果不是免费模型，显示试用区块
                 if not is_free_model:
                     trial_section = self.create_trial_section()
-                    layout.addWidget(trial_section, 5)
+                    self._insert_action_section(trial_section, 5)
                 
                 # 下载按钮：免费模型始终显示，收费模型只在试用中显示
                 if not is_paid_model or has_active_trial:
                     self.download_section = self.create_download_section()
-                    layout.addWidget(self.download_section, 5)
-        
-        layout.addStretch()
-        return panel
+                    self._insert_action_section(self.download_section, 5)
     
-    def create_section(self, title, content):
-        """创建通用信息区块"""
+    def _create_section_widget(self):
+        """创建信息区块容器（背景、圆角由 detail_section 样式绘制）"""
         section = QWidget()
-        section.setStyleSheet("""
-            QWidget {
-                background-color: #252525;
-                border-radius: 8px;
-                padding: 20px;
-            }
-        """)
+        section.setProperty("detail_section", True)
+        section.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+        return section
+    
+    def create_section(self, title, content):
+        """创建通用信息区块，返回 (区块, 内容标签)"""
+        section = self._create_section_widget()
         layout = QVBoxLayout(section)
         layout.setSpacing(10)
         
         title_label = QLabel(title)
-        # 基础样式由全局样式表提供，只设置特殊样式
-        title_label.setStyleSheet("font-size: 18px; font-weight: bold; border: none; background-color: transparent; padding: 0px;")
+        title_label.setProperty("section_title", True)
         layout.addWidget(title_label)
         
         content_label = QLabel(content)
         content_label.setWordWrap(True)
-        # 基础样式由全局样式表提供，只设置特殊样式
-        content_label.setStyleSheet("font-size: 14px; line-height: 1.6; border: none; background-color: transparent; padding: 0px;")
+        content_label.setProperty("section_text", True)
         layout.addWidget(content_label)
         
-        return section
+        return section, content_label
     
     def create_audition_section(self):
         """创建试听区块"""
-        section = QWidget()
-        section.setStyleSheet("""
-            QWidget {
-                background-color: #252525;
-                border-radius: 8px;
-                padding: 20px;
-            }
-        """)
+        section = self._create_section_widget()
         layout = QVBoxLayout(section)
         layout.setSpacing(15)
         
         title_label = QLabel("试听")
-        # 基础样式由全局样式表提供，只设置特殊样式
-        title_label.setStyleSheet("font-size: 18px; font-weight: bold; border: none; background-color: transparent; padding: 0px;")
+        title_label.setProperty("section_title", True)
         layout.addWidget(title_label)
         
         # 播放器控件
@@ -821,23 +1677,13 @@ class ModelDetailPage(QWidget):
         player_layout.setContentsMargins(0, 0, 0, 0)
         player_layout.setSpacing(12)
         
-        play_btn = QPushButton("▶")
+        play_btn = QPushButton()
+        play_btn.setIcon(glyph_icon("▶"))
+        play_btn.setIconSize(QSize(16, 16))
         play_btn.setFixedSize(40, 40)
-        play_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #8b5cf6;
-                color: #ffffff;
-                border: none;
-                border-radius: 20px;
-                font-size: 16px;
-                padding: 0px;
-            }
-            QPushButton:hover {
-                background-color: #7c3aed;
-            }
-        """)
-        play_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        play_btn.clicked.connect(self.on_play_clicked)
+        play_btn.setProperty("player_btn", True)
+        play_btn.setCursor(hand_cursor())
+        play_btn.clicked.connect(self.on_play_clicked, Qt.ConnectionType.DirectConnection)
         self.play_btn = play_btn
         player_layout.addWidget(play_btn)
         
@@ -846,41 +1692,17 @@ class ModelDetailPage(QWidget):
         progress_slider.setMinimum(0)
         progress_slider.setMaximum(1000)  # 使用1000作为最大值，便于精确控制
         progress_slider.setValue(0)
-        progress_slider.setStyleSheet("""
-            QSlider::groove:horizontal {
-                background-color: #3d3d3d;
-                height: 4px;
-                border-radius: 2px;
-            }
-            QSlider::handle:horizontal {
-                background-color: #8b5cf6;
-                width: 12px;
-                height: 12px;
-                border-radius: 6px;
-                margin: -4px 0;
-            }
-            QSlider::handle:horizontal:hover {
-                background-color: #7c3aed;
-                width: 14px;
-                height: 14px;
-                border-radius: 7px;
-            }
-            QSlider::sub-page:horizontal {
-                background-color: #8b5cf6;
-                border-radius: 2px;
-            }
-        """)
+        progress_slider.setProperty("player_slider", True)
         progress_slider.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
-        progress_slider.sliderPressed.connect(self.on_slider_pressed)
-        progress_slider.sliderReleased.connect(self.on_slider_released)
-        progress_slider.valueChanged.connect(self.on_slider_value_changed)
+        progress_slider.sliderPressed.connect(self.on_slider_pressed, Qt.ConnectionType.DirectConnection)
+        progress_slider.sliderReleased.connect(self.on_slider_released, Qt.ConnectionType.DirectConnection)
+        progress_slider.valueChanged.connect(self.on_slider_value_changed, Qt.ConnectionType.DirectConnection)
         self.progress_slider = progress_slider
         player_layout.addWidget(progress_slider)
         
         # 时间显示
         time_label = QLabel("0:00 / 0:00")
-        # 基础样式由全局样式表提供，只设置特殊字体大小
-        time_label.setStyleSheet("font-size: 14px;")
+        time_label.setProperty("player_time", True)
         self.time_label = time_label
         player_layout.addWidget(time_label)
         
@@ -893,9 +1715,6 @@ class ModelDetailPage(QWidget):
         if not model_name:
             return
         
-        # 支持的音频格式
-        audio_extensions = (".wav", ".mp3", ".flac", ".m4a", ".ogg", ".aac")
-        
         # 首先尝试从本地查找（已下载的模型）
         # 从服务端的models目录查找（使用file_path）
         file_path = self.model_data.get("pth_path", "")
@@ -905,51 +1724,40 @@ class ModelDetailPage(QWidget):
             full_file_path = os.path.join(models_base_path, file_path)
             file_dir = os.path.dirname(full_file_path)
             
-            if os.path.exists(file_dir):
-                                # 查找音频文件
-                audio_files = [f for f in os.listdir(file_dir) 
-                    if f.lower().endswith(audio_extensions)]
-                if audio_files:
-                    self.audio_file_path = os.path.join(file_dir, audio_files[0])
+            if os.path.isdir(file_dir):
+                # 查找音频文件
+                audio_path = _scan_model_dir(file_dir)[1]
+                if audio_path:
+                    self.audio_file_path = audio_path
                     return
         
-        # 如果file_path不可用，尝试从 models 目录查找（通过模型名称匹配）
-        models_dir = os.path.join(os.getcwd(), "models")
-        if os.path.exists(models_dir):
-            for item in os.listdir(models_dir):
-                model_dir_path = os.path.join(models_dir, item)
-                if os.path.isdir(model_dir_path):
-                    # 检查目录名或json中的name是否匹配
-                    json_files = [f for f in os.listdir(model_dir_path) if f.endswith(".json")]
-                    if json_files:
-                        try:
-                            json_path = os.path.join(model_dir_path, json_files[0])
-                            with open(json_path, 'r', encoding='utf-8') as f:
-                                model_info = json.load(f)
-                            if model_info.get("name", item) == model_name:
-                                # 查找音频文件
-                                audio_files = [f for f in os.listdir(model_dir_path) 
-                                             if f.lower().endswith(audio_extensions)]
-                                if audio_files:
-                                    self.audio_file_path = os.path.join(model_dir_path, audio_files[0])
-                                    return
-                        except:
-                            pass
-                    # 如果目录名匹配
-                    if item == model_name:
-                        audio_files = [f for f in os.listdir(model_dir_path) 
-                                     if f.lower().endswith(audio_extensions)]
-                        if audio_files:
-                            self.audio_file_path = os.path.join(model_dir_path, audio_files[0])
-                            return
+        # 如果file_path不可用，尝试从 models 目录查找（通过模型名称或目录名匹配）
+        audio_path = find_indexed_audio(os.path.join(os.getcwd(), "models"), model_name)
+        if audio_path:
+            self.audio_file_path = audio_path
+            return
         
         # 如果本地找不到，尝试从服务端下载（在线模型）
         # 标记需要从服务端下载
         self.audio_file_path = None
         self.need_download_audio = True
     
+    def _set_play_glyph(self, ch):
+        """切换播放按钮的图标（▶ / ⏸），与当前显示相同时不重设图标"""
+        # 结束、停止等信号会连续把按钮设回 ▶；按钮显示“下载中...”文字时总是恢复图标
+        if ch == self.play_glyph and not self.play_btn.text():
+            return
+        self.play_glyph = ch
+        self.play_btn.setText("")
+        self.play_btn.setIcon(glyph_icon(ch))
+    
     def on_play_clicked(self):
         """播放按钮点击"""
+        # 打开详情页时不扫描模型目录，第一次播放时再查找音频文件
+        if not self.audio_file_searched:
+            self.audio_file_searched = True
+            self.find_audio_file()
+        
         # 如果需要从服务端下载音频
         if self.need_download_audio and not self.audio_file_path:
             self._download_audio_for_preview()
@@ -960,29 +1768,23 @@ class ModelDetailPage(QWidget):
             return
         
         if not self.audio_player:
-            # 初始化音频播放器
-            self.audio_output = QAudioOutput()
-            self.audio_player = QMediaPlayer()
-            self.audio_player.setAudioOutput(self.audio_output)
-            self.audio_player.mediaStatusChanged.connect(self.on_media_status_changed)
-            self.audio_player.positionChanged.connect(self.on_position_changed)
-            self.audio_player.durationChanged.connect(self.on_duration_changed)
-            self.audio_player.playbackStateChanged.connect(self.on_playback_state_changed)
+            # 使用共用的试听播放器，不再为每个详情页创建播放管线
+            self.audio_player = preview_player()
+            self.audio_player.attach(self)
         
         if self.is_playing:
             # 暂停播放
             self.audio_player.pause()
             self.is_playing = False
             if self.play_btn:
-                self.play_btn.setText("▶")
+                self._set_play_glyph("▶")
         else:
             # 开始播放
-            if self.audio_player.source() != QUrl.fromLocalFile(self.audio_file_path):
-                self.audio_player.setSource(QUrl.fromLocalFile(self.audio_file_path))
+            self.audio_player.set_source_path(self.audio_file_path)
             self.audio_player.play()
             self.is_playing = True
             if self.play_btn:
-                self.play_btn.setText("⏸")
+                self._set_play_glyph("⏸")
     
     def _download_audio_for_preview(self):
         """从服务端下载音频文件用于试听"""
@@ -994,6 +1796,7 @@ class ModelDetailPage(QWidget):
         # 禁用播放按钮
         if self.play_btn:
             self.play_btn.setEnabled(False)
+            self.play_btn.setIcon(QIcon())
             self.play_btn.setText("下载中...")
         
         # 创建临时目录保存音频文件
@@ -1037,7 +1840,7 @@ class ModelDetailPage(QWidget):
         # 恢复播放按钮
         if self.play_btn:
             self.play_btn.setEnabled(True)
-            self.play_btn.setText("▶")
+            self._set_play_glyph("▶")
         
         if result.get("success"):
             # 如果设置了自动播放，开始播放
@@ -1058,42 +1861,53 @@ class ModelDetailPage(QWidget):
         # 恢复播放按钮
         if self.play_btn:
             self.play_btn.setEnabled(True)
-            self.play_btn.setText("▶")
+            self._set_play_glyph("▶")
         
         QMessageBox.warning(self, "错误", f"音频下载失败: {error_msg}")
     
     def on_media_status_changed(self, status):
         """媒体状态改变"""
-        from PyQt6.QtMultimedia import QMediaPlayer
-        if status == QMediaPlayer.MediaStatus.EndOfMedia:
+        if status == END_OF_MEDIA:
             self.is_playing = False
+            self.position_timer.stop()
             if self.play_btn:
-                self.play_btn.setText("▶")
+                self._set_play_glyph("▶")
             if self.time_label:
                 self.time_label.setText("0:00 / 0:00")
     
     def on_position_changed(self, position):
-        """播放位置改变"""
+        """播放位置改变：只记录位置，定时器到点后再刷新显示"""
+        self.pending_position = position
+        if not self.position_timer.isActive():
+            self.position_timer.start()
+    
+    def _flush_position(self):
+        """把最近一次上报的播放位置刷新到时间标签和进度条"""
         if self.audio_player and self.time_label:
             duration = self.audio_player.duration()
             if duration > 0:
-                pos_min = position // 60000
-                pos_sec = (position % 60000) // 1000
-                dur_min = duration // 60000
-                dur_sec = (duration % 60000) // 1000
-                self.time_label.setText(f"{pos_min}:{pos_sec:02d} / {dur_min}:{dur_sec:02d}")
+                position = self.pending_position
+                self.time_label.setText(format_play_time(position // 1000) + self._duration_text(duration))
                 
                 # 更新进度条（如果不在拖拽状态）
                 if not self.is_slider_dragging and self.progress_slider:
                     progress_value = int((position / duration) * 1000)
-                    self.progress_slider.setValue(progress_value)
+                    # 值没变就不设置；程序设置进度时屏蔽 valueChanged，拖拽显示的槽函数不会被调用
+                    if progress_value != self.progress_slider.value():
+                        with QSignalBlocker(self.progress_slider):
+                            self.progress_slider.setValue(progress_value)
+    
+    def _duration_text(self, duration):
+        """时间标签的总时长部分，总时长不变时复用上次格式化的文本"""
+        if duration != self.duration_ms:
+            self.duration_ms = duration
+            self.duration_text = f" / {format_play_time(duration // 1000)}"
+        return self.duration_text
     
     def on_duration_changed(self, duration):
         """总时长改变"""
         if self.time_label and duration > 0:
-            dur_min = duration // 60000
-            dur_sec = (duration % 60000) // 1000
-            self.time_label.setText(f"0:00 / {dur_min}:{dur_sec:02d}")
+            self.time_label.setText("0:00" + self._duration_text(duration))
     
     def on_slider_pressed(self):
         """滑块按下"""
@@ -1115,44 +1929,32 @@ class ModelDetailPage(QWidget):
             duration = self.audio_player.duration()
             if duration > 0:
                 position = int((value / 1000.0) * duration)
-                pos_min = position // 60000
-                pos_sec = (position % 60000) // 1000
-                dur_min = duration // 60000
-                dur_sec = (duration % 60000) // 1000
-                self.time_label.setText(f"{pos_min}:{pos_sec:02d} / {dur_min}:{dur_sec:02d}")
+                self.time_label.setText(format_play_time(position // 1000) + self._duration_text(duration))
     
     def on_playback_state_changed(self, state):
         """播放状态改变"""
-        from PyQt6.QtMultimedia import QMediaPlayer
-        if state == QMediaPlayer.PlaybackState.StoppedState:
+        if state == PLAYBACK_STOPPED:
             self.is_playing = False
+            self.position_timer.stop()
             if self.play_btn:
-                self.play_btn.setText("▶")
+                self._set_play_glyph("▶")
             if self.progress_slider:
-                self.progress_slider.setValue(0)
+                with QSignalBlocker(self.progress_slider):
+                    self.progress_slider.setValue(0)
     
     def create_trial_section(self):
         """创建试用区块"""
-        section = QWidget()
-        section.setStyleSheet("""
-            QWidget {
-                background-color: #252525;
-                border-radius: 8px;
-                padding: 20px;
-            }
-        """)
+        section = self._create_section_widget()
         layout = QVBoxLayout(section)
         layout.setSpacing(15)
         
         title_label = QLabel("试用")
-        # 基础样式由全局样式表提供，只设置特殊样式
-        title_label.setStyleSheet("font-size: 18px; font-weight: bold; border: none; background-color: transparent; padding: 0px;")
+        title_label.setProperty("section_title", True)
         layout.addWidget(title_label)
         
         info_label = QLabel("在这里可以进行音色的试用!所有的音色均可试用60分钟,点击按钮后开始计时。")
         info_label.setWordWrap(True)
-        # 基础样式由全局样式表提供，只设置特殊字体大小
-        info_label.setStyleSheet("font-size: 14px; border: none; background-color: transparent; padding: 0px;")
+        info_label.setProperty("section_text", True)
         layout.addWidget(info_label)
         
         # 试用按钮和时间显示
@@ -1160,26 +1962,14 @@ class ModelDetailPage(QWidget):
         
         self.trial_btn = QPushButton("开始试用")
         self.trial_btn.setFixedSize(120, 40)
-        self.trial_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #8b5cf6;
-                color: #ffffff;
-                border: none;
-                border-radius: 6px;
-                font-size: 16px;
-                font-weight: bold;
-                padding: 0px;
-            }
-            QPushButton:hover {
-                background-color: #7c3aed;
-            }
-        """)
-        self.trial_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.trial_btn.clicked.connect(self.on_trial_clicked)
+        self.trial_btn.setProperty("section_btn", True)
+        self.trial_btn.setProperty("trial_btn", True)
+        self.trial_btn.setCursor(hand_cursor())
+        self.trial_btn.clicked.connect(self.on_trial_clicked, Qt.ConnectionType.DirectConnection)
         trial_layout.addWidget(self.trial_btn, alignment=Qt.AlignmentFlag.AlignCenter)
         
         self.trial_time_label = QLabel("剩余时间: 60:00")
-        self.trial_time_label.setStyleSheet("color: #8b5cf6; font-size: 16px; font-weight: bold; border: none; background-color: transparent; padding: 0px;")
+        self.trial_time_label.setProperty("trial_time", True)
         self.trial_time_label.setVisible(False)
         trial_layout.addWidget(self.trial_time_label, alignment=Qt.AlignmentFlag.AlignCenter)
         trial_layout.addStretch()
@@ -1189,26 +1979,17 @@ class ModelDetailPage(QWidget):
     
     def create_download_section(self):
         """创建下载区块"""
-        section = QWidget()
-        section.setStyleSheet("""
-            QWidget {
-                background-color: #252525;
-                border-radius: 8px;
-                padding: 20px;
-            }
-        """)
+        section = self._create_section_widget()
         layout = QVBoxLayout(section)
         layout.setSpacing(15)
         
         title_label = QLabel("下载")
-        # 基础样式由全局样式表提供，只设置特殊样式
-        title_label.setStyleSheet("font-size: 18px; font-weight: bold; border: none; background-color: transparent; padding: 0px;")
+        title_label.setProperty("section_title", True)
         layout.addWidget(title_label)
         
         info_label = QLabel("在这里可以直接下载音色!下载完毕后点击使用。如果有任何问题点击联系客服界面,联系客服。")
         info_label.setWordWrap(True)
-        # 基础样式由全局样式表提供，只设置特殊字体大小
-        info_label.setStyleSheet("font-size: 14px; border: none; background-color: transparent; padding: 0px;")
+        info_label.setProperty("section_text", True)
         layout.addWidget(info_label)
         
         # 下载按钮和进度条
@@ -1216,56 +1997,23 @@ class ModelDetailPage(QWidget):
         download_layout.setContentsMargins(0, 0, 24, 0)
         download_layout.setSpacing(10)
         
-        btn_layout = QHBoxLayout()
-        
         self.download_btn = QPushButton("开始下载")
         self.download_btn.setFixedSize(96, 36)
-        self.download_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #8b5cf6;
-                color: #ffffff;
-                border: none;
-                border-radius: 6px;
-                font-size: 14px;
-                font-weight: bold;
-                padding: 0px;
-            }
-            QPushButton:hover {
-                background-color: #7c3aed;
-            }
-            QPushButton:disabled {
-                background-color: #555555;
-                color: #888888;
-            }
-        """)
-        self.download_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.download_btn.clicked.connect(self.on_download_clicked)
+        self.download_btn.setProperty("section_btn", True)
+        self.download_btn.setProperty("download_btn", True)
+        self.download_btn.setCursor(hand_cursor())
+        self.download_btn.clicked.connect(self.on_download_clicked, Qt.ConnectionType.DirectConnection)
         
         # 进度条
         self.download_progress = QProgressBar()
         self.download_progress.setVisible(False)
-        self.download_progress.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #555555;
-                border-radius: 4px;
-                text-align: center;
-                background-color: #1a1a1a;
-                color: #ffffff;
-            }
-            QProgressBar::chunk {
-                background-color: #8b5cf6;
-                border-radius: 3px;
-            }
-        """)
+        self.download_progress.setProperty("download_progress", True)
         self.download_status_label = QLabel("")
         self.download_status_label.setVisible(False)
-        self.download_status_label.setStyleSheet("color: #888888; font-size: 12px; border: none; background-color: transparent; padding: 0px;")
+        self.download_status_label.setProperty("section_hint", True)
         
-        btn_layout.addStretch()
-        btn_layout.addWidget(self.download_btn, alignment=Qt.AlignmentFlag.AlignCenter)
-        btn_layout.addStretch()
-        
-        download_layout.addLayout(btn_layout)
+        # 按钮直接居中放入下载布局，不再用两侧弹性空间的水平布局包一层
+        download_layout.addWidget(self.download_btn, alignment=Qt.AlignmentFlag.AlignCenter)
         download_layout.addWidget(self.download_progress)
         download_layout.addWidget(self.download_status_label)
         
@@ -1311,24 +2059,24 @@ class ModelDetailPage(QWidget):
             
             # 更新状态
             self.trial_active = True
-            self.trial_seconds = remaining_seconds
+            self.trial_end_time = time.monotonic() + remaining_seconds
             
             # 更新主页的试用记录（如果可用）
             if self.home_page and hasattr(self.home_page, 'user_trials'):
                 model_uid = self.model_data.get("uid")
                 if model_uid:
                     # 更新或添加试用记录
-                    self.home_page.user_trials[model_uid] = {
+                    self.home_page.user_trials[model_uid] = set_trial_deadline({
                         "model_uid": model_uid,
                         "model_name": self.model_data.get("name", ""),
                         "is_active": True,
                         "remaining_seconds": remaining_seconds,
                         "start_time": data.get("start_time"),
                         "end_time": data.get("end_time")
-                    }
+                    })
             
-            # 启动本地倒计时
-            self.trial_timer.start(1000)  # 每秒更新
+            # 启动本地倒计时（剩余时间按结束时刻计算，不累计定时器误差）
+            self.trial_timer.start(500)
             
             # 启动服务器同步定时器（每30秒同步一次）
             if not self.trial_sync_timer:
@@ -1457,7 +2205,8 @@ class ModelDetailPage(QWidget):
             if trial_data:
                 # 使用本地已加载的数据
                 is_active = trial_data.get("is_active", False)
-                remaining_seconds = trial_data.get("remaining_seconds", 0)
+                # 记录可能是几分钟前加载的，剩余时间按结束时刻重新计算
+                remaining_seconds = trial_remaining_seconds(trial_data)
                 
                 # 构造与API返回格式一致的数据结构
                 result = {
@@ -1505,10 +2254,10 @@ class ModelDetailPage(QWidget):
             if is_active:
                 # 有正在进行的试用
                 self.trial_active = True
-                self.trial_seconds = remaining_seconds
+                self.trial_end_time = time.monotonic() + remaining_seconds
                 
                 # 启动本地倒计时
-                self.trial_timer.start(1000)
+                self.trial_timer.start(500)
                 
                 # 启动服务器同步定时器
                 if not self.trial_sync_timer:
@@ -1629,7 +2378,7 @@ class ModelDetailPage(QWidget):
             if data.get("is_active"):
                 # 更新剩余时间
                 remaining = data.get("remaining_seconds", 0)
-                self.trial_seconds = remaining
+                self.trial_end_time = time.monotonic() + remaining
                 self.update_trial_time()
             else:
                 # 试用已过期
@@ -1645,7 +2394,7 @@ class ModelDetailPage(QWidget):
         
         # 更新状态
         self.trial_active = False
-        self.trial_seconds = 0
+        self.trial_end_time = 0.0
         
         # 更新UI
         if hasattr(self, 'trial_btn') and self.trial_btn:
@@ -1656,13 +2405,16 @@ class ModelDetailPage(QWidget):
     
     def update_trial_time(self):
         """更新试用时间"""
-        if self.trial_seconds > 0:
-            minutes = self.trial_seconds // 60
-            seconds = self.trial_seconds % 60
+        remaining = math.ceil(self.trial_end_time - time.monotonic())
+        if remaining > 0:
+            if remaining < len(TRIAL_TIME_TEXTS):
+                text = TRIAL_TIME_TEXTS[remaining]
+            else:
+                minutes, seconds = divmod(remaining, 60)
+                text = f"剩余时间: {minutes:02d}:{seconds:02d}"
             if hasattr(self, 'trial_time_label') and self.trial_time_label:
-                self.trial_time_label.setText(f"剩余时间: {minutes:02d}:{seconds:02d}")
+                self.trial_time_label.setText(text)
                 self.trial_time_label.setVisible(True)
-            self.trial_seconds -= 1
         else:
             # 时间到了
             self._end_trial()
@@ -1775,63 +2527,50 @@ class ModelDetailPage(QWidget):
     
     def create_use_section(self):
         """创建使用区块（已购买/已下载）"""
-        section = QWidget()
-        section.setStyleSheet("""
-            QWidget {
-                background-color: #252525;
-                border-radius: 8px;
-                padding: 20px;
-            }
-        """)
+        section = self._create_section_widget()
         layout = QVBoxLayout(section)
         layout.setSpacing(15)
         
         title_label = QLabel("使用")
-        title_label.setStyleSheet("font-size: 18px; font-weight: bold; border: none; background-color: transparent; padding: 0px;")
+        title_label.setProperty("section_title", True)
         layout.addWidget(title_label)
         
         # 状态提示
         status_label = QLabel("✓ 已下载，可直接使用")
-        status_label.setStyleSheet("color: #4caf50; font-size: 14px; border: none; background-color: transparent; padding: 0px;")
+        status_label.setProperty("use_status", True)
         layout.addWidget(status_label)
         
         # 使用按钮
         use_layout = QHBoxLayout()
         use_btn = QPushButton("前往推理页面使用")
         use_btn.setFixedSize(200, 40)
-        use_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #8b5cf6;
-                color: #ffffff;
-                border: none;
-                border-radius: 6px;
-                padding: 10px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #7c3aed;
-            }
-        """)
-        use_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        use_btn.clicked.connect(self.on_use_clicked)
+        use_btn.setProperty("section_btn", True)
+        use_btn.setProperty("use_btn", True)
+        use_btn.setCursor(hand_cursor())
+        use_btn.clicked.connect(self.on_use_clicked, Qt.ConnectionType.DirectConnection)
         use_layout.addWidget(use_btn, alignment=Qt.AlignmentFlag.AlignCenter)
         use_layout.addStretch()
         
         layout.addLayout(use_layout)
         
-        # 显示模型文件路径信息
-        pth_path = self.model_data.get("pth_path", "")
-        index_path = self.model_data.get("index_path", "")
-        if pth_path:
-            path_info = QLabel(f"模型文件: {pth_path}")
-            path_info.setStyleSheet("color: #888888; font-size: 12px; border: none; background-color: transparent; padding: 5px 0px;")
-            path_info.setWordWrap(True)
-            layout.addWidget(path_info)
+        # 显示模型文件路径信息（切换模型时只更新文字）
+        path_info = QLabel()
+        path_info.setProperty("section_hint", True)
+        path_info.setProperty("use_path", True)
+        path_info.setWordWrap(True)
+        layout.addWidget(path_info)
+        self.use_path_label = path_info
+        self._update_use_path()
         
         layout.addStretch()
         return section
     
+    def _update_use_path(self):
+        """使用区块中的模型文件路径，没有路径时隐藏"""
+        pth_path = self.model_data.get("pth_path", "")
+        self.use_path_label.setText(f"模型文件: {pth_path}" if pth_path else "")
+        self.use_path_label.setVisible(bool(pth_path))
+    
     def on_use_clicked(self):
         """使用按钮点击"""
         QMessageBox.information(self, "提示", "请前往推理页面使用该模型")
@@ -1856,9 +2595,6 @@ class ModelDetailPage(QWidget):
         self.download_status_label.setVisible(True)
         self.download_status_label.setText("准备下载...")
         
-        # 连接进度更新信号
-        self.progress_updated.connect(self._update_download_progress)
-        
         # 创建异步下载任务
         async def download_and_extract():
             try:
@@ -1874,12 +2610,19 @@ class ModelDetailPage(QWidget):
                         # 使用信号在主线程中更新UI
                         self.progress_updated.emit(percent, total, status_text)
                 
+                # py7zr 可以直接解压内存中的压缩包；7z 命令行只能解压磁盘上的文件
+                try:
+                    import py7zr
+                except ImportError:
+                    py7zr = None
+                
                 # 下载压缩包（使用服务端原始文件名）
                 self.progress_updated.emit(0, 0, "正在下载压缩包...")
                 result = await models_api.download_model_package(
                     model_uuid,
                     client_models_dir,  # 只传目录，不传文件名
-                    progress_callback=progress_callback
+                    progress_callback=progress_callback,
+                    memory_limit=PACKAGE_MEMORY_LIMIT if py7zr else 0
                 )
                 
                 if not result.get("success"):
@@ -1888,39 +2631,31 @@ class ModelDetailPage(QWidget):
                         "message": result.get("message", "下载失败")
                     }
                 
-                # 获取服务端返回的文件名和完整路径
+                # 获取服务端返回的文件名和完整路径（下载到内存时没有路径）
                 package_path = result.get("file_path")
                 
                 # 解压压缩包
                 self.progress_updated.emit(50, 100, "正在解压...")
                 
-                # 解压到models目录
-                try:
-                    import py7zr
-                    with py7zr.SevenZipFile(package_path, mode='r') as archive:
-                        archive.extractall(path=client_models_dir)
-                except ImportError:
-                    # 如果没有py7zr，尝试使用7z命令行工具
-                    import subprocess
-                    result = subprocess.run(
-                        ['7z', 'x', package_path, f'-o{client_models_dir}', '-y'],
-                        capture_output=True,
-                        text=True
-                    )
-                    if result.returncode != 0:
-                        return {
-                            "success": False,
-                            "message": f"解压失败: {result.stderr}"
-                        }
-                except Exception as e:
+                # 解压到models目录：在线程池中进行（7z 的文件目录在压缩包末尾，需要完整下载后才能解压），
+                # 解压期间每秒刷新一次状态文字，进度不会一直停在“正在解压...”
+                extract_future = asyncio.get_running_loop().run_in_executor(
+                    None, extract_model_package, result.get("file_data") or package_path, client_models_dir
+                )
+                elapsed = 0
+                while not (await asyncio.wait({extract_future}, timeout=1))[0]:
+                    elapsed += 1
+                    self.progress_updated.emit(50, 100, f"正在解压... {elapsed}s")
+                extracted, message = extract_future.result()
+                if not extracted:
                     return {
                         "success": False,
-                        "message": f"解压失败: {str(e)}"
+                        "message": message
                     }
                 
                 # 解压完成后删除7z压缩包
                 try:
-                    if os.path.exists(package_path):
+                    if package_path and os.path.exists(package_path):
                         os.remove(package_path)
                         print(f"已删除压缩包: {package_path}")
                 except Exception as e:
@@ -1959,6 +2694,10 @@ class ModelDetailPage(QWidget):
             QMessageBox.information(self, "成功", "模型下载并解压完成！")
             self.download_status_label.setText("下载完成！")
             
+            # 本地模型有变化，试听音频重新查找
+            invalidate_audio_index()
+            self.audio_file_searched = False
+            
             # 重新加载本地模型uid列表
             if self.home_page:
                 self.home_page._load_local_model_uids()
@@ -2017,6 +2756,9 @@ class ModelDetailPage(QWidget):
                         # 创建使用区块
                         self.use_section = self.create_use_section()
                         parent_layout.insertWidget(index, self.use_section)
+                        # 没有试用区块时，右侧只剩使用区块，切换模型时可以复用
+                        if not (hasattr(self, 'trial_btn') and self.trial_btn):
+                            self._action_mode = "use"
     
     def _refresh_management_page(self):
         """刷新管理页面（保持当前筛选条件）"""
@@ -2085,6 +2827,8 @@ class ModelDetailPage(QWidget):
 
 class HomePage(BasePage):
     """主页"""
+    GRID_COLUMNS = 5  # 每行卡片数
+    DETAIL_PAGE_CACHE_SIZE = 4  # 保留最近打开的详情页数量
     
     def __init__(self):
         super().__init__("主页")
@@ -2094,6 +2838,10 @@ class HomePage(BasePage):
         self.current_model = None  # 当前查看的模型
         self.local_model_uids = set()  # 本地模型的uid集合（用于快速查找）
         self.user_trials = {}  # 用户的试用记录 {model_uid: trial_data}
+        self._cards = {}  # 已创建的模型卡片 {model_id: ModelCard}，过滤时复用
+        self._card_pool = []  # 模型列表重新加载后回收的卡片，换数据后复用
+        self._name_lower = []  # 与 models_data 对应的小写名称，过滤时不再逐个 lower()
+        self._by_category = {}  # 分类 -> models_data 下标列表
         self.setup_content()
         # 不在初始化时加载模型，等待登录成功后再加载
         # self.load_models()  # 加载模型数据
@@ -2105,6 +2853,9 @@ class HomePage(BasePage):
         if not main_layout:
             main_layout = QVBoxLayout(self)
         
+        # 页面内所有卡片、详情页和工具栏共用一份样式表
+        self.setStyleSheet(MODEL_PAGE_QSS)
+        
         # 清除基类创建的默认内容
         while main_layout.count():
             child = main_layout.takeAt(0)
@@ -2128,25 +2879,7 @@ class HomePage(BasePage):
         # 模型网格区域
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
-        # 基础样式由全局样式表提供，只设置特殊样式
-        self.scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: none;
-            }
-            QScrollBar:vertical {
-                background-color: #2d2d2d;
-                width: 8px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #8b5cf6;
-                border-radius: 6px;
-                min-height: 30px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #7c3aed;
-            }
-        """)
+        self.scroll_area.setProperty("model_scroll", True)
         
         # 网格容器
         grid_widget = QWidget()
@@ -2157,6 +2890,8 @@ class HomePage(BasePage):
         self.grid_layout = QGridLayout()
         self.grid_layout.setSpacing(20)
         self.grid_layout.setContentsMargins(0, 0, 0, 0)
+        for col in range(self.GRID_COLUMNS):
+            self.grid_layout.setColumnStretch(col, 0)  # 不拉伸列，让卡片靠左
         
         grid_container.addLayout(self.grid_layout)
         grid_container.addStretch()  # 添加右侧拉伸，使卡片靠左对齐
@@ -2169,18 +2904,14 @@ class HomePage(BasePage):
         self.stacked_widget.addWidget(self.list_page)
         
         # 详情页面（初始为空，点击详情时创建）
-        self.detail_page = None
+        self.detail_page = None  # 当前显示的详情页
+        # 最近打开的详情页 {model_id: ModelDetailPage}，按使用顺序排列，再次打开同一模型时直接切换
+        self.detail_pages = OrderedDict()
         
         # 加载状态标签
         self.loading_label = QLabel("正在加载模型数据...")
         self.loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.loading_label.setStyleSheet("""
-            QLabel {
-                color: #8b5cf6;
-                font-size: 16px;
-                padding: 20px;
-            }
-        """)
+        self.loading_label.setProperty("model_loading", True)
         list_layout.addWidget(self.loading_label)
 
         list_layout.addStretch()
@@ -2192,14 +2923,11 @@ class HomePage(BasePage):
     def create_toolbar(self):
         """创建顶部工具栏"""
         toolbar = QWidget()
-        toolbar.setStyleSheet("background-color: transparent;")
+        toolbar.setProperty("model_toolbar", True)
         
-        layout = QVBoxLayout(toolbar)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(0)
-        
-        # 分类标签栏
-        categories_layout = QHBoxLayout()
+        # 分类标签栏（直接作为工具栏的布局）
+        categories_layout = QHBoxLayout(toolbar)
+        categories_layout.setContentsMargins(0, 0, 0, 0)
         categories_layout.setSpacing(10)
         
         self.category_buttons = {}
@@ -2209,39 +2937,16 @@ class HomePage(BasePage):
         for category in categories:
             btn = QPushButton(category)
             btn.setCheckable(True)
-            btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            btn.clicked.connect(lambda checked, cat=category: self.on_category_changed(cat))
+            btn.setCursor(hand_cursor())
+            # 分类名保存在按钮属性上，所有分类按钮共用一个槽函数
+            btn.setProperty("category", category)
+            btn.clicked.connect(self._on_category_btn_clicked, Qt.ConnectionType.DirectConnection)
             
             if category == "全部":
                 btn.setChecked(True)
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #e74c3c;
-                        color: #ffffff;
-                        border: none;
-                        border-radius: 6px;
-                        padding: 8px 20px;
-                        font-size: 14px;
-                        font-weight: bold;
-                    }
-                """)
+                btn.setProperty("category_state", "all")
             else:
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #2d2d2d;
-                        color: #ffffff;
-                        border: none;
-                        border-radius: 6px;
-                        padding: 8px 20px;
-                        font-size: 14px;
-                    }
-                    QPushButton:hover {
-                        background-color: #3d3d3d;
-                    }
-                    QPushButton:checked {
-                        background-color: #8b5cf6;
-                    }
-                """)
+                btn.setProperty("category_state", "idle")
             
             self.category_buttons[category] = btn
             categories_layout.addWidget(btn)
@@ -2250,23 +2955,15 @@ class HomePage(BasePage):
         
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("请输入你想要的声音")
-        # 基础样式由全局样式表提供，只设置特殊样式
-        self.search_input.setStyleSheet("""
-            QLineEdit {
-                background-color: #1e1e1e;
-                border: 2px solid #3d3d3d;
-                border-radius: 8px;
-                padding: 2px 15px;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border: 2px solid #8b5cf6;
-            }
-        """)
-        self.search_input.textChanged.connect(self.on_search_changed)
+        self.search_input.setProperty("model_search", True)
+        self.search_input.textChanged.connect(self.on_search_changed, Qt.ConnectionType.DirectConnection)
         categories_layout.addWidget(self.search_input)
-
-        layout.addLayout(categories_layout)
+        
+        # 搜索防抖：输入停止 150ms 后才过滤，避免每个按键都重排网格
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self.filter_models)
         
         # 保存工具栏和分类布局的引用，以便后续更新
         self.toolbar_widget = toolbar
@@ -2288,9 +2985,19 @@ class HomePage(BasePage):
             # 显示空列表
             self.models_data = []
             self.filtered_models = []
+            self._clear_cards()
+            self._build_filter_index()
             self.update_model_grid()
             return
         
+        # 已有加载任务在后台进行时不重复发起请求
+        if self.load_thread and self.load_thread.isRunning():
+            return
+        
+        # 请求期间显示加载提示
+        self.scroll_area.hide()
+        self.loading_label.show()
+        
         # 登录成功后，加载用户的试用记录
         self._load_user_trials()
         
@@ -2361,6 +3068,9 @@ class HomePage(BasePage):
             self.models_data.sort(key=lambda x: x.get("name", "").lower())
             self.filtered_models = self.models_data.copy()
             
+            # 模型数据已更新，旧卡片作废
+            self._clear_cards()
+            self._build_filter_index()
             # 更新模型网格
             self.update_model_grid()
         else:
@@ -2369,6 +3079,8 @@ class HomePage(BasePage):
             # 如果API加载失败，显示空列表
             self.models_data = []
             self.filtered_models = []
+            self._clear_cards()
+            self._build_filter_index()
             self.update_model_grid()
     
         # 清理线程
@@ -2383,32 +3095,14 @@ class HomePage(BasePage):
         self.local_model_uids.clear()
         models_dir = os.path.join(os.getcwd(), "models")
         
-        if not os.path.exists(models_dir):
+        if not os.path.isdir(models_dir):
             return
         
-        # 扫描models目录下的所有子目录
-        for item in os.listdir(models_dir):
-            model_dir_path = os.path.join(models_dir, item)
-            
-            # 只处理目录
-            if not os.path.isdir(model_dir_path):
-                continue
-            
-            # 查找json信息文件（通常是info.json）
-            json_files = [f for f in os.listdir(model_dir_path) if f.endswith(".json")]
-            
-            if json_files:
-                json_path = os.path.join(model_dir_path, json_files[0])
-                try:
-                    with open(json_path, 'r', encoding='utf-8') as f:
-                        model_info = json.load(f)
-                    
-                    # 读取uid（支持uuid或uid字段）
-                    model_uid = model_info.get("uuid") or model_info.get("uid")
-                    if model_uid:
-                        self.local_model_uids.add(model_uid)
-                except Exception as e:
-                    print(f"读取本地模型信息文件失败 {json_path}: {e}")
+        # 扫描models目录下的所有子目录，读取uid（支持uuid或uid字段）
+        for _, model_info, _ in _iter_model_dirs(models_dir):
+            model_uid = model_info.get("uuid") or model_info.get("uid")
+            if model_uid:
+                self.local_model_uids.add(model_uid)
     
     def _load_user_trials(self):
         """加载用户的试用记录"""
@@ -2444,7 +3138,7 @@ class HomePage(BasePage):
             for trial in trials:
                 model_uid = trial.get("model_uid")
                 if model_uid:
-                    self.user_trials[model_uid] = trial
+                    self.user_trials[model_uid] = set_trial_deadline(trial)
             
             print(f"已加载 {len(self.user_trials)} 条试用记录")
             if len(trials) > 0:
@@ -2479,6 +3173,8 @@ class HomePage(BasePage):
         # 如果API加载失败，显示空列表
         self.models_data = []
         self.filtered_models = []
+        self._clear_cards()
+        self._build_filter_index()
         self.update_model_grid()
         
         # 清理线程
@@ -2542,19 +3238,8 @@ class HomePage(BasePage):
             if file_path:
                 file_dir = os.path.dirname(file_path)
                 file_name_without_ext = os.path.splitext(os.path.basename(file_path))[0]
-                image_extensions = [".png", ".jpg", ".jpeg", ".bmp", ".gif", ".webp"]
-                for ext in image_extensions:
-                    potential_image = os.path.join(file_dir, file_name_without_ext + ext)
-                    if os.path.exists(potential_image):
-                        image_path = potential_image
-                        break
-                
-                # 如果没找到，尝试查找目录下的任何图片文件
-                if not image_path and os.path.exists(file_dir):
-                    for f in os.listdir(file_dir):
-                        if f.lower().endswith((".png", ".jpg", ".jpeg", ".bmp", ".gif", ".webp")):
-                            image_path = os.path.join(file_dir, f)
-                            break
+                if file_dir:
+                    image_path = _find_model_image(file_dir, file_name_without_ext)
             
             # 如果file_path不可用，尝试在服务端的models目录中查找
             if not image_path and file_path:
@@ -2562,22 +3247,8 @@ class HomePage(BasePage):
                 models_base_path = os.path.join(os.getcwd(), "models")
                 full_file_path = os.path.join(models_base_path, file_path)
                 file_dir = os.path.dirname(full_file_path)
-                
-                if os.path.exists(file_dir):
-                    file_name_without_ext = os.path.splitext(os.path.basename(file_path))[0]
-                    image_extensions = [".png", ".jpg", ".jpeg", ".bmp", ".gif", ".webp"]
-                    for ext in image_extensions:
-                        potential_image = os.path.join(file_dir, file_name_without_ext + ext)
-                        if os.path.exists(potential_image):
-                            image_path = potential_image
-                            break
-                    
-                    # 如果没找到，尝试查找目录下的任何图片文件
-                    if not image_path:
-                        for f in os.listdir(file_dir):
-                            if f.lower().endswith((".png", ".jpg", ".jpeg", ".bmp", ".gif", ".webp")):
-                                image_path = os.path.join(file_dir, f)
-                                break
+                file_name_without_ext = os.path.splitext(os.path.basename(file_path))[0]
+                image_path = _find_model_image(file_dir, file_name_without_ext)
         
         # 构建转换后的数据
         converted_model = {
@@ -2586,7 +3257,7 @@ class HomePage(BasePage):
             "name": api_model.get("name", "未知模型"),
             "image": image_path,
             "description": api_model.get("description", ""),
-            "category": api_model.get("category", "全部") or "全部",  # 确保category不为None
+            "category": sys.intern(api_model.get("category", "全部") or "全部"),  # 确保category不为None；驻留后相同分类共用一个字符串
             "version": api_model.get("version", "V1"),
             "price": api_model.get("price", 0.0),  # 价格
             "sample_rate": "48K",  # API中没有sample_rate字段，使用默认值
@@ -2608,107 +3279,147 @@ class HomePage(BasePage):
         
         return converted_model
     
+    def _on_category_btn_clicked(self):
+        """分类按钮点击：从发送者的属性取分类名"""
+        self.on_category_changed(self.sender().property("category"))
+    
     def on_category_changed(self, category):
         """分类改变"""
         self.current_category = category
+        # 分类切换立即过滤，已排队的搜索过滤不再需要
+        self._search_timer.stop()
         
-        # 更新按钮样式
-        for cat, btn in self.category_buttons.items():
-            if cat == category:
-                if category == "全部":
-                    btn.setStyleSheet("""
-                        QPushButton {
-                            background-color: #e74c3c;
-                            color: #ffffff;
-                            border: none;
-                            border-radius: 6px;
-                            padding: 8px 20px;
-                            font-size: 14px;
-                            font-weight: bold;
-                        }
-                    """)
+        # 更新按钮样式：只切换动态属性并重新匹配样式，不重新解析样式表
+        self.toolbar_widget.setUpdatesEnabled(False)
+        try:
+            for cat, btn in self.category_buttons.items():
+                if cat == category:
+                    state = "all" if category == "全部" else "active"
                 else:
-                    btn.setStyleSheet("""
-                        QPushButton {
-                            background-color: #8b5cf6;
-                            color: #ffffff;
-                            border: none;
-                            border-radius: 6px;
-                            padding: 8px 20px;
-                            font-size: 14px;
-                            font-weight: bold;
-                        }
-                    """)
-            else:
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #2d2d2d;
-                        color: #ffffff;
-                        border: none;
-                        border-radius: 6px;
-                        padding: 8px 20px;
-                        font-size: 14px;
-                    }
-                    QPushButton:hover {
-                        background-color: #3d3d3d;
-                    }
-                """)
+                    state = "idle"
+                btn.setChecked(cat == category)
+                btn.setProperty("category_state", state)
+                btn.style().unpolish(btn)
+                btn.style().polish(btn)
+        finally:
+            self.toolbar_widget.setUpdatesEnabled(True)
         
         # 过滤模型
         self.filter_models()
     
     def on_search_changed(self, text):
-        """搜索文本改变"""
-        self.filter_models()
+        """搜索文本改变（重新计时，停止输入后再过滤）"""
+        self._search_timer.start()
+    
+    def _build_filter_index(self):
+        """模型数据加载后预先建立过滤索引：小写名称和分类下标"""
+        self._name_lower = [model["name"].lower() for model in self.models_data]
+        self._by_category = defaultdict(list)
+        self._by_category["全部"] = list(range(len(self.models_data)))
+        for i, model in enumerate(self.models_data):
+            # 支持多个分类，用分号分隔
+            for cat in {sys.intern(cat.strip()) for cat in model.get("category", "").split(";")}:
+                if cat != "全部":
+                    self._by_category[cat].append(i)
     
     def filter_models(self):
         """过滤模型"""
         search_text = self.search_input.text().strip().lower()
         
-        self.filtered_models = []
-        for model in self.models_data:
-            # 分类过滤（支持多个分类，用分号分隔）
-            if self.current_category != "全部":
-                model_categories = [cat.strip() for cat in model.get("category", "").split(";")]
-                if self.current_category not in model_categories:
-                    continue
-            
-            # 搜索过滤
-            if search_text and search_text not in model["name"].lower():
-                continue
-            
-            self.filtered_models.append(model)
+        # 先按分类取候选下标，再用预先计算的小写名称做搜索过滤
+        candidates = self._by_category.get(self.current_category, [])
+        self.filtered_models = [
+            self.models_data[i] for i in candidates
+            if not search_text or search_text in self._name_lower[i]
+        ]
         
         self.update_model_grid()
     
     def update_model_grid(self):
-        """更新模型网格"""
-        # 清除现有卡片（先清理资源）
-        while self.grid_layout.count():
-            child = self.grid_layout.takeAt(0)
-            if child.widget():
-                widget = child.widget()
-                # 如果是ModelCard且使用了在线加载，先清理其资源
-                if isinstance(widget, ModelCard) and widget.load_online:
-                    widget.cleanup()
-                widget.deleteLater()
-        
-        # 添加模型卡片（主页使用，优先从服务端获取图片）
-        columns = 5  # 每行5个
-        for i, model_data in enumerate(self.filtered_models):
-            card = ModelCard(model_data, load_online=True)  # 主页使用在线加载
-            card.detail_clicked.connect(self.on_model_detail_clicked)
+        """更新模型网格（复用已创建的卡片，只重新排列，不重复创建控件）"""
+        # 批量增删期间暂停重绘和布局计算，结束后只重新布局、刷新一次
+        grid_widget = self.scroll_area.widget()
+        grid_widget.setUpdatesEnabled(False)
+        self.grid_layout.setEnabled(False)
+        try:
+            # 从网格中取出现有卡片（不销毁）
+            while self.grid_layout.count():
+                self.grid_layout.takeAt(0)
             
-            row = i // columns
-            col = i % columns
-            self.grid_layout.addWidget(card, row, col)
-        
-        # 设置列的对齐方式，使卡片靠左对齐
-        for col in range(columns):
-            self.grid_layout.setColumnStretch(col, 0)  # 不拉伸列，让卡片靠左
-        
-        # 添加弹性空间（只在最后一行）
-        self.grid_layout.setRowStretch(self.grid_layout.rowCount(), 1)
+            # 不在过滤结果中的卡片隐藏
+            visible_ids = {model_data["id"] for model_data in self.filtered_models}
+            for model_id, card in self._cards.items():
+                if model_id not in visible_ids:
+                    card.hide()
+            
+            # 添加模型卡片（主页使用，优先从服务端获取图片）
+            columns = self.GRID_COLUMNS
+            for i, model_data in enumerate(self.filtered_models):
+                card = self._cards.get(model_data["id"])
+                if card is None:
+                    if self._card_pool:
+                        # 优先从卡片池取出回收的卡片，只替换数据
+                        card = self._card_pool.pop()
+                        card.set_model(model_data)
+                    else:
+                        card = ModelCard(model_data, load_online=True)  # 主页使用在线加载
+                        card.detail_clicked.connect(self.on_model_detail_clicked, Qt.ConnectionType.DirectConnection)
+                    self._cards[model_data["id"]] = card
+            
+                row = i // columns
+                col = i % columns
+                self.grid_layout.addWidget(card, row, col)
+                card.show()
+            
+            # 卡片尺寸固定，有卡片的行列直接定为卡片尺寸，不必根据卡片重新推算；
+            # 空行空列清零，弹性空间只放在最后一行卡片之后
+            used_columns = min(len(self.filtered_models), columns)
+            for col in range(columns):
+                self.grid_layout.setColumnMinimumWidth(col, ModelCard.CARD_WIDTH if col < used_columns else 0)
+            rows = (len(self.filtered_models) + columns - 1) // columns
+            for row in range(self.grid_layout.rowCount()):
+                self.grid_layout.setRowMinimumHeight(row, ModelCard.CARD_HEIGHT if row < rows else 0)
+                self.grid_layout.setRowStretch(row, 0)
+            self.grid_layout.setRowStretch(rows, 1)
+        finally:
+            self.grid_layout.setEnabled(True)
+            self.grid_layout.activate()
+            grid_widget.setUpdatesEnabled(True)
+    
+    def _clear_cards(self):
+        """回收所有卡片到卡片池（模型数据重新加载时调用）"""
+        while self.grid_layout.count():
+            self.grid_layout.takeAt(0)
+        for card in self._cards.values():
+            # 停止下载线程和动图，隐藏后放入卡片池
+            card.cleanup()
+            if card.movie:
+                card.movie.stop()
+            card.hide()
+            self._card_pool.append(card)
+        self._cards.clear()
+    
+    def _card_detail_image(self, model_id):
+        """从对应的 ModelCard 取详情页用的图片对象（QMovie、图片路径或 QPixmap）"""
+        model_image = None
+        widget = self._cards.get(model_id)
+        if widget is not None:
+            # 优先使用 movie（GIF），否则按图片路径加载原图
+            if hasattr(widget, 'movie') and widget.movie:
+                # 创建新的 QMovie 实例（因为 QMovie 不能直接复制）
+                # 如果 ModelCard 有图片路径，使用路径创建新的 QMovie
+                if widget.model_image and os.path.exists(widget.model_image):
+                    model_image = QMovie(widget.model_image)
+                    model_image.start()
+            elif not widget.has_placeholder and widget.model_image and os.path.exists(widget.model_image):
+                # 卡片上只有缩略图，详情页按路径加载原图
+                model_image = widget.model_image
+            elif hasattr(widget, 'image_label') and widget.image_label and not widget.has_placeholder:
+                # 尝试从 image_label 获取 pixmap（备用方案）
+                pixmap = widget.image_label.pixmap()
+                if pixmap and not pixmap.isNull():
+                    model_image = QPixmap(pixmap)
+        return model_image
     
     def on_model_detail_clicked(self, model_id):
         """模型详情按钮点击"""
@@ -2723,40 +3434,12 @@ class HomePage(BasePage):
             QMessageBox.warning(self, "错误", "未找到模型信息")
             return
         
-        # 查找对应的 ModelCard，获取图片对象
-        model_image = None
-        for i in range(self.grid_layout.count()):
-            item = self.grid_layout.itemAt(i)
-            if item and item.widget():
-                widget = item.widget()
-                if isinstance(widget, ModelCard) and widget.model_id == model_id:
-                    # 优先使用 movie（GIF），否则使用 original_pixmap
-                    if hasattr(widget, 'movie') and widget.movie:
-                        # 创建新的 QMovie 实例（因为 QMovie 不能直接复制）
-                        # 如果 ModelCard 有图片路径，使用路径创建新的 QMovie
-                        if widget.model_image and os.path.exists(widget.model_image):
-                            model_image = QMovie(widget.model_image)
-                            model_image.start()
-                    elif hasattr(widget, 'original_pixmap') and widget.original_pixmap and not widget.original_pixmap.isNull():
-                        # 复制 QPixmap
-                        model_image = QPixmap(widget.original_pixmap)
-                    elif hasattr(widget, 'image_label') and widget.image_label:
-                        # 尝试从 image_label 获取 pixmap（备用方案）
-                        pixmap = widget.image_label.pixmap()
-                        if pixmap and not pixmap.isNull():
-                            model_image = QPixmap(pixmap)
-                    break
-        
         # 检查本地是否有相同uid的模型
         model_uid = model_data.get("uid")
         is_downloaded = False
         if model_uid and model_uid in self.local_model_uids:
             is_downloaded = True
         
-        # 创建或更新详情页面
-        if self.detail_page:
-            self.detail_page.deleteLater()
-        
         # 添加更多详情数据
         detail_data = model_data.copy()
         
@@ -2784,29 +3467,42 @@ class HomePage(BasePage):
             "version": "V1",
             "sample_rate": "48K",
             "category_name": category_name,
-            "description": detail_data.get("description", "茶韵悠悠可音袅袅少御音介于少女与御姐之间既有少女清脆又具御姐沉稳圆润柔和年龄感适中清嗓咳嗽呢喃细语悄悄话 笑声 自带情绪感")
+            "description": detail_data.get("description", DEFAULT_MODEL_DESCRIPTION)
         })
         
         # 如果本地已下载，显示已下载样式
-        # 尝试获取主窗口引用
-        main_window = None
-        parent = self.parent()
-        while parent:
-            if hasattr(parent, 'pages'):
-                main_window = parent
-                break
-            parent = parent.parent()
-        
-        self.detail_page = ModelDetailPage(detail_data, is_purchased=is_downloaded, home_page=self, main_window=main_window, model_image=model_image)
-        self.detail_page.back_clicked.connect(self.show_list_page)
-        self.detail_page.setParent(self.stacked_widget)
-        
-        # 如果详情页面不在堆叠中，添加它
-        if self.stacked_widget.indexOf(self.detail_page) == -1:
-            self.stacked_widget.addWidget(self.detail_page)
+        # 最近打开的几个模型保留各自的详情页；超出数量时复用最久未打开的页面
+        # 卡片图片只在需要重新加载时才取，复用页面时不会白白创建并启动 GIF 动画
+        detail_page = self.detail_pages.get(model_id)
+        if detail_page is not None:
+            self.detail_pages.move_to_end(model_id)
+            if detail_page.model_data == detail_data and detail_page.is_purchased == is_downloaded:
+                # 模型数据和下载状态都没变：控件和图片原样保留，只重新检查试用状态
+                detail_page.reopen()
+            else:
+                detail_page.set_model(detail_data, is_purchased=is_downloaded, model_image=self._card_detail_image(model_id))
+        elif len(self.detail_pages) < self.DETAIL_PAGE_CACHE_SIZE:
+            # 尝试获取主窗口引用
+            main_window = None
+            parent = self.parent()
+            while parent:
+                if hasattr(parent, 'pages'):
+                    main_window = parent
+                    break
+                parent = parent.parent()
+            
+            detail_page = ModelDetailPage(detail_data, is_purchased=is_downloaded, home_page=self, main_window=main_window, model_image=self._card_detail_image(model_id))
+            detail_page.back_clicked.connect(self.show_list_page, Qt.ConnectionType.DirectConnection)
+            self.stacked_widget.addWidget(detail_page)
+            self.detail_pages[model_id] = detail_page
+        else:
+            _, detail_page = self.detail_pages.popitem(last=False)
+            detail_page.set_model(detail_data, is_purchased=is_downloaded, model_image=self._card_detail_image(model_id))
+            self.detail_pages[model_id] = detail_page
         
         # 切换到详情页面
-        self.stacked_widget.setCurrentWidget(self.detail_page)
+        self.detail_page = detail_page
+        self.stacked_widget.setCurrentWidget(detail_page)
         self.current_model = model_data
     
     def show_list_page(self):
@@ -17,13 +17,16 @@ import torchaudio.transforms as tat
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QSlider, QComboBox, QRadioButton, QButtonGroup, QGroupBox, QFrame,
-    QFileDialog, QMessageBox, QSizePolicy, QScrollArea
+    QFileDialog, QMessageBox, QSizePolicy, QScrollArea, QApplication
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QEvent, QThreadPool
 from PyQt6.QtGui import QFont, QResizeEvent, QPixmap, QMovie
 
 # 导入工具函数
-from .tools import create_slider
+from .tools import create_slider, SLIDER_QSS
+from .home_page import (
+    get_placeholder, load_cached_pixmap, find_cached_pixmap, cache_loaded_image, ImageLoader,
+)
 from api.auth import auth_api
 
 # 导入项目模块（延迟导入，避免阻塞）
@@ -34,6 +37,104 @@ sys.path.append(os.getcwd())
 # 全局变量
 flag_vc = False
 
+# 推理页样式表：在页面上设置一次，按钮通过动态属性匹配
+INFERENCE_PAGE_QSS = """
+    /* 紫色主要按钮（保存预设、开始变声） */
+    QPushButton[preset_btn=true],
+    QPushButton[vc_start_btn=true] {
+        background-color: #8b5cf6;
+        color: #ffffff;
+        border: none;
+    }
+    QPushButton[preset_btn=true]:hover,
+    QPushButton[vc_start_btn=true]:hover {
+        background-color: #7c3aed;
+    }
+    QPushButton[preset_btn=true]:pressed,
+    QPushButton[vc_start_btn=true]:pressed {
+        background-color: #6d28d9;
+    }
+    QPushButton[preset_btn=true] {
+        border-radius: 6px;
+        padding: 10px 20px;
+        font-size: 14px;
+    }
+
+    /* 开始/停止变声，停止按钮沿用全局按钮配色 */
+    QPushButton[vc_start_btn=true],
+    QPushButton[vc_stop_btn=true] {
+        border-radius: 8px;
+        padding: 15px 30px;
+        font-size: 16px;
+        font-weight: bold;
+    }
+
+    QPushButton[refresh_btn=true] {
+        border-image: url('res/刷新图标.png');
+    }
+"""
+
+# 模型列表面板样式表：在面板上设置一次，卡片及其子控件通过动态属性匹配
+MODEL_LIST_PANEL_QSS = """
+    QFrame {
+        background-color: #252525;
+        border: 2px solid #3d3d3d;
+        border-radius: 12px;
+    }
+
+    /* 模型卡片，card_state 为空表示还没有选中过任何模型 */
+    QFrame[inference_card=true] {
+        background-color: #252525;
+        border: 1px solid #3d3d3d;
+        border-radius: 1px;
+    }
+    QFrame[inference_card=true][card_state="unselected"] {
+        border: 2px solid #3d3d3d;
+        border-radius: 8px;
+    }
+    QFrame[inference_card=true][card_state="selected"] {
+        background-color: #2d2d2d;
+        border: 2px solid #8b5cf6;
+        border-radius: 8px;
+    }
+    QFrame[inference_card=true]:hover {
+        border: 2px solid #8b5cf6;
+        background-color: #2d2d2d;
+    }
+    QLabel[inference_card_image=true] {
+        background-color: #1e1e1e;
+        border-radius: 0px;
+        border: 1px solid #3d3d3d;
+    }
+    QLabel[inference_card_name=true] {
+        font-size: 26px;
+        font-weight: bold;
+        padding: 0px 3px;
+        border: none;
+        background-color: transparent;
+    }
+    QLabel[inference_card_text=true] {
+        font-size: 12px;
+        border: none;
+        background-color: transparent;
+        padding: 0px 5px;
+    }
+"""
+
+# 设备选择组的样式表：在容器上设置一次，标签通过动态属性匹配
+DEVICE_GROUP_QSS = """
+    QFrame {
+        background-color: #252525;
+        border: none;
+    }
+    QLabel[device_label=true] {
+        color: #ffffff;
+        font-size: 14px;
+        border: none;
+        background-color: transparent;
+    }
+"""
+
 
 class AdaptiveLabel(QLabel):
     """自适应字体大小的QLabel"""
@@ -139,17 +240,7 @@ class ModelCard(QFrame):
     
     def setup_ui(self):
         """设置UI"""
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #252525;
-                border: 1px solid #3d3d3d;
-                border-radius: 1px;
-            }
-            QFrame:hover {
-                border: 2px solid #8b5cf6;
-                background-color: #2d2d2d;
-            }
-        """)
+        self.setProperty("inference_card", True)
         
         layout = QHBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -159,66 +250,37 @@ class ModelCard(QFrame):
         image_label = QLabel()
         image_label.setFixedSize(100, 100)
         image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        image_label.setStyleSheet("""
-            QLabel {
-                background-color: #1e1e1e;
-                border-radius: 0px;
-                border: 1px solid #3d3d3d;
-            }
-        """)
+        image_label.setProperty("inference_card_image", True)
         
-        # 如果有图片路径，尝试加载图片
-        if self.model_image and os.path.exists(self.model_image):
+        # 如果有图片路径，尝试加载图片（文件不存在时 QMovie 无效、load_cached_pixmap 返回空图，不再单独检查）
+        loaded = False
+        if self.model_image:
             try:
                 # 检查是否为 GIF 动图
                 file_ext = os.path.splitext(self.model_image)[1].lower()
                 if file_ext == '.gif':
                     # 使用 QMovie 加载 GIF 动图
                     movie = QMovie(self.model_image)
-                    movie.setScaledSize(image_label.size())
-                    image_label.setMovie(movie)
-                    movie.start()
-                    # 保存 movie 引用，防止被垃圾回收
-                    self.movie = movie
-                elif file_ext == '.png' or file_ext == '.jpg' or file_ext == '.jpeg' or file_ext == '.bmp' or file_ext == '.webp':
-                    # 使用 QPixmap 加载静态图片（PNG、JPG等）
-                    pixmap = QPixmap(self.model_image)
-                    if not pixmap.isNull():
-                        # 缩放图片以适应标签大小，保持宽高比
-                        scaled_pixmap = pixmap.scaled(
-                            100, 100, 
-                            Qt.AspectRatioMode.KeepAspectRatio, 
-                            Qt.TransformationMode.SmoothTransformation
-                        )
-                        image_label.setPixmap(scaled_pixmap)
-                    else:
-                        # 图片加载失败，显示占位符
-                        placeholder = self.model_name[0] if self.model_name else "?"
-                        image_label.setText(f"<div style='font-size: 64px; color: #8b5cf6;'>{placeholder}</div>")
+                    if movie.isValid():
+                        movie.setScaledSize(image_label.size())
+                        image_label.setMovie(movie)
+                        movie.start()
+                        # 保存 movie 引用，防止被垃圾回收
+                        self.movie = movie
+                        loaded = True
                 else:
-                    # 其他格式，尝试使用 QPixmap
-                    pixmap = QPixmap(self.model_image)
+                    # 静态图片（PNG、JPG等）按标签大小缩放（保持宽高比），缩放结果会被缓存
+                    pixmap = load_cached_pixmap(self.model_image, 100, 100)
                     if not pixmap.isNull():
-                        scaled_pixmap = pixmap.scaled(
-                            100, 100, 
-                            Qt.AspectRatioMode.KeepAspectRatio, 
-                            Qt.TransformationMode.SmoothTransformation
-                        )
-                        image_label.setPixmap(scaled_pixmap)
-                    else:
-                        placeholder = self.model_name[0] if self.model_name else "?"
-                        image_label.setText(f"<div style='font-size: 64px; color: #8b5cf6;'>{placeholder}</div>")
+                        image_label.setPixmap(pixmap)
+                        loaded = True
             except Exception as e:
-                # 图片加载出错，显示占位符
                 print(f"加载图片失败 {self.model_image}: {e}")
-                placeholder = self.model_name[0] if self.model_name else "?"
-                image_label.setText(f"<div style='font-size: 64px; color: #8b5cf6;'>{placeholder}</div>")
-        else:
-            # 根据名称生成占位符
+        if not loaded:
+            # 没有图片或加载失败，根据名称生成占位符
             placeholder = self.model_name[0] if self.model_name else "?"
-            image_label.setText(f"<div style='font-size: 64px; color: #8b5cf6;'>{placeholder}</div>")
+            image_label.setPixmap(get_placeholder(placeholder, 100, 64))
         
-        image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(image_label)
         
         right_layout = QVBoxLayout()
@@ -227,12 +289,12 @@ class ModelCard(QFrame):
         # 名称
         name_label = QLabel(self.model_name)
         name_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-        name_label.setStyleSheet("font-size: 26px; font-weight: bold; padding: 0px 3px; border: none; background-color: transparent;")
+        name_label.setProperty("inference_card_name", True)
         right_layout.addWidget(name_label)
         content_label = QLabel(self.model_data.get("description", ""))
         content_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
         content_label.setWordWrap(True)
-        content_label.setStyleSheet("font-size: 12px; padding: 0px; border: none; background-color: transparent; padding: 0px 5px;")
+        content_label.setProperty("inference_card_text", True)
         right_layout.addWidget(content_label)
         layout.addLayout(right_layout)
     
@@ -245,26 +307,11 @@ class ModelCard(QFrame):
     def set_selected(self, selected):
         """设置选中状态"""
         self.is_selected = selected
-        if selected:
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #2d2d2d;
-                    border: 2px solid #8b5cf6;
-                    border-radius: 8px;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #252525;
-                    border: 2px solid #3d3d3d;
-                    border-radius: 8px;
-                }
-                QFrame:hover {
-                    border: 2px solid #8b5cf6;
-                    background-color: #2d2d2d;
-                }
-            """)
+        self.setProperty("card_state", "selected" if selected else "unselected")
+        self.style().unpolish(self)
+        self.style().polish(self)
+        # 选中前后边框宽度不同，通知 QFrame 重新计算边框占用的内容区域
+        QApplication.sendEvent(self, QEvent(QEvent.Type.StyleChange))
 
 
 class GUIConfig:
@@ -365,6 +412,7 @@ class InferencePage(QWidget):
         self.preview_overlay = None  # 预览区域底部蒙层
         self.preview_movie = None  # 预览区域的 GIF movie（如果使用 GIF）
         self.preview_is_gif = False  # 预览区域是否为 GIF
+        self.preview_image_path = None  # 正在线程池中解码的预览大图
         
         # 初始化设备列表
         self.update_devices()
@@ -389,6 +437,7 @@ class InferencePage(QWidget):
     
     def init_ui(self):
         """初始化UI"""
+        self.setStyleSheet(INFERENCE_PAGE_QSS)
         main_layout = QHBoxLayout(self)
         main_layout.setContentsMargins(20, 20, 20, 20)
         main_layout.setSpacing(20)
@@ -577,13 +626,7 @@ class InferencePage(QWidget):
     def create_model_list_panel(self):
         """创建模型列表面板"""
         panel = QFrame()
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: #252525;
-                border: 2px solid #3d3d3d;
-                border-radius: 12px;
-            }
-        """)
+        panel.setStyleSheet(MODEL_LIST_PANEL_QSS)
         
         layout = QVBoxLayout(panel)
         layout.setContentsMargins(6, 6, 6, 6)
@@ -854,21 +897,38 @@ class InferencePage(QWidget):
     
     def update_model_list(self):
         """更新模型列表显示"""
-        # 清除现有卡片
-        while self.model_list_layout.count():
-            child = self.model_list_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-        
-        self.model_cards = []
-        
-        # 添加模型卡片
-        for model_data in self.models_data:
-            card = ModelCard(model_data)
-            card.clicked.connect(self.on_model_selected)
-            self.model_cards.append(card)
-            self.model_list_layout.addWidget(card)
-        self.model_list_layout.addStretch()
+        # 批量增删期间暂停重绘，结束后只刷新一次
+        self.model_list_widget.setUpdatesEnabled(False)
+        try:
+            # 清除现有卡片
+            while self.model_list_layout.count():
+                child = self.model_list_layout.takeAt(0)
+                if child.widget():
+                    child.widget().deleteLater()
+            
+            self.model_cards = []
+            
+            # 添加模型卡片
+            for model_data in self.models_data:
+                card = ModelCard(model_data)
+                card.clicked.connect(self.on_model_selected)
+                self.model_cards.append(card)
+                self.model_list_layout.addWidget(card)
+            self.model_list_layout.addStretch()
+        finally:
+            self.model_list_widget.setUpdatesEnabled(True)
+    
+    def _on_preview_image_loaded(self, path, image):
+        """线程池中的预览大图解码完成"""
+        # 解码期间可能已经选中了其他模型
+        if path != self.preview_image_path:
+            return
+        self.preview_image_path = None
+        if image.isNull():
+            # 图片加载失败，显示文本
+            self.preview_image_label.setText(self.current_model["name"])
+            return
+        self.preview_image_label.setPixmap(cache_loaded_image(path, image))
     
     def on_model_selected(self, model_data):
         """模型被选中"""
@@ -881,6 +941,7 @@ class InferencePage(QWidget):
         
         # 更新预览区域
         model_image = model_data.get("image", "")
+        self.preview_image_path = None  # 上一个模型还没解码完的预览图不再显示
         
         # 如果有图片，显示图片；否则显示文本
         if model_image and os.path.exists(model_image):
@@ -909,12 +970,16 @@ class InferencePage(QWidget):
                         self.preview_movie.stop()
                         self.preview_movie = None
                     
-                    pixmap = QPixmap(model_image)
-                    if not pixmap.isNull():
+                    # 预览用原图，缓存中没有时到线程池中解码，切换模型时不阻塞界面线程
+                    pixmap = find_cached_pixmap(model_image)
+                    if pixmap is not None:
                         self.preview_image_label.setPixmap(pixmap)
                     else:
-                        # 图片加载失败，显示文本
-                        self.preview_image_label.setText(model_data["name"])
+                        self.preview_image_label.clear()
+                        self.preview_image_path = model_image
+                        loader = ImageLoader(model_image)
+                        loader.signals.finished.connect(self._on_preview_image_loaded)
+                        QThreadPool.globalInstance().start(loader)
             except Exception as e:
                 # 图片加载出错，显示文本
                 print(f"加载预览图片失败 {model_image}: {e}")
@@ -967,13 +1032,14 @@ class InferencePage(QWidget):
     def create_control_panel(self):
         """创建控制面板"""
         panel = QFrame()
+        # 滑块样式并入面板样式表，只设置一次
         panel.setStyleSheet("""
             QFrame {
                 background-color: #252525;
                 border: 2px solid #3d3d3d;
                 border-radius: 12px;
             }
-        """)
+        """ + SLIDER_QSS)
         
         layout = QHBoxLayout(panel)
         layout.setContentsMargins(15, 15, 15, 15)
@@ -1017,28 +1083,13 @@ class InferencePage(QWidget):
         # 保存预设按钮和刷新
         button_layout = QHBoxLayout()
         save_btn = QPushButton("保存预设")
-        save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #8b5cf6;
-                color: #ffffff;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 20px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #7c3aed;
-            }
-            QPushButton:pressed {
-                background-color: #6d28d9;
-            }
-        """)
+        save_btn.setProperty("preset_btn", True)
         save_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         save_btn.clicked.connect(self.on_save_preset)
         
         refresh_btn = QPushButton("")
         refresh_btn.setFixedSize(40, 40)
-        refresh_btn.setStyleSheet("border-image: url('res/刷新图标.png');")
+        refresh_btn.setProperty("refresh_btn", True)
         refresh_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         refresh_btn.clicked.connect(self.on_refresh_devices)
         
@@ -1153,36 +1204,13 @@ class InferencePage(QWidget):
         button_layout.setSpacing(15)
         
         self.start_btn = QPushButton("开始变声")
-        self.start_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #8b5cf6;
-                color: #ffffff;
-                border: none;
-                border-radius: 8px;
-                padding: 15px 30px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #7c3aed;
-            }
-            QPushButton:pressed {
-                background-color: #6d28d9;
-            }
-        """)
+        self.start_btn.setProperty("vc_start_btn", True)
         self.start_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.start_btn.clicked.connect(self.on_start_vc)
         
         self.stop_btn = QPushButton("停止变声")
         # 基础样式由全局样式表提供，只设置特殊样式
-        self.stop_btn.setStyleSheet("""
-            QPushButton {
-                border-radius: 8px;
-                padding: 15px 30px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-        """)
+        self.stop_btn.setProperty("vc_stop_btn", True)
         self.stop_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.stop_btn.clicked.connect(self.on_stop_vc)
         self.stop_btn.setEnabled(False)
@@ -1197,13 +1225,13 @@ class InferencePage(QWidget):
     def create_device_group(self, label_text, device_list, default_device):
         """创建设备选择组，返回容器和下拉框"""
         container = QFrame()
-        container.setStyleSheet("QFrame { background-color: #252525; border: none; }")
+        container.setStyleSheet(DEVICE_GROUP_QSS)
         layout = QVBoxLayout(container)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(8)
         
         label = QLabel(label_text)
-        label.setStyleSheet("color: #ffffff; font-size: 14px; border: none; background-color: transparent;")
+        label.setProperty("device_label", True)
         layout.addWidget(label)
         
         combo = QComboBox()
@@ -1,30 +1,197 @@
 """管理页面"""
-import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QLineEdit, QScrollArea, QGridLayout, QFrame, QStackedWidget,
     QMessageBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QSize
+from PyQt6.QtCore import Qt, pyqtSignal, QSize, QEvent, QTimer
 from PyQt6.QtGui import QFont, QIcon, QPixmap, QMovie
 
 from .base_page import BasePage
 from api.auth import auth_api
 from api.models import models_api
-from .home_page import ModelCard, ModelDetailPage
+from .home_page import (
+    ModelCard, ModelDetailPage, MODEL_PAGE_QSS, DEFAULT_MODEL_DESCRIPTION,
+    IMAGE_EXTENSIONS, hand_cursor, load_json_cached,
+)
 import asyncio
 
 
+# 模型目录中按扩展名区分的文件类型（图片扩展名不区分大小写，查不到时再按小写查一次）
+MODEL_FILE_KINDS = {
+    ".pth": "pth",
+    ".index": "index",
+    ".json": "json",
+    **{ext: "image" for ext in IMAGE_EXTENSIONS},
+}
+
+# 管理页在共用样式表之外的规则：分类按钮带图标、文字左对齐，以及当前选择指示器
+MANAGEMENT_PAGE_QSS = """
+    QPushButton[category_state="idle"],
+    QPushButton[category_state="active"],
+    QPushButton[category_state="all"] {
+        text-align: left;
+    }
+    QLabel[selection_indicator=true] {
+        background-color: #8b5cf6;
+        color: #ffffff;
+        border: none;
+        border-radius: 6px;
+        padding: 8px 15px;
+        font-size: 14px;
+        font-weight: bold;
+    }
+"""
+
+
+def build_bigram_index(names):
+    """为名称列表建立二元字符倒排索引：二元组 -> 名称下标集合"""
+    index = {}
+    for i, name in enumerate(names):
+        for j in range(len(name) - 1):
+            index.setdefault(name[j:j + 2], set()).add(i)
+    return index
+
+
+def _read_model_dir(model_dir_path: str, item: str):
+    """读取一个模型目录（只做文件读取，可在线程池中并行执行），没有 .pth 文件时返回 None"""
+    # 一次遍历模型目录，按扩展名取第一个 .pth、.index、.json 和图片文件的路径
+    # （文件名可以是任意的，只看扩展名；目录项自带完整路径，不必再拼接）
+    found = {}
+    with os.scandir(model_dir_path) as it:
+        for entry in it:
+            ext = os.path.splitext(entry.name)[1]
+            kind = MODEL_FILE_KINDS.get(ext)
+            if kind is None and ext.lower() in IMAGE_EXTENSIONS:
+                kind = "image"
+            if kind and kind not in found and entry.is_file():
+                found[kind] = entry.path
+                if len(found) == 4:
+                    break
+    pth_path = found.get("pth")
+    json_path = found.get("json")
+    image_path = found.get("image")
+    if not pth_path:
+        return None  # 如果没有.pth文件，跳过这个目录
+    
+    # 没有index文件时设为空字符串
+    index_path = found.get("index", "")
+    
+    # 读取json信息文件（如果存在）
+    model_info = {}
+    if json_path:
+        try:
+            model_info = load_json_cached(json_path)
+        except Exception as e:
+            print(f"读取模型信息文件失败 {json_path}: {e}")
+    
+    # 构建模型数据
+    model_name = model_info.get("name", item)  # 如果json中没有name，使用目录名
+    
+    # 确定模型图片路径（优先级：json中的image > 目录下的图片文件）
+    model_image = model_info.get("image", "")
+    if model_image:
+        # 如果json中指定了图片路径
+        if not os.path.isabs(model_image):
+            # 如果是相对路径，转换为相对于模型目录的路径
+            model_image = os.path.join(model_dir_path, model_image)
+    elif image_path:
+        # 如果json中没有指定，但目录下有图片文件，使用第一个找到的图片
+        model_image = image_path
+    else:
+        # 没有图片
+        model_image = ""
+    
+    # 获取分类信息（从json中读取，默认为"免费音色"，支持多个分类用分号分隔）
+    category = model_info.get("category", "免费音色")
+    # 判断是否为官方音色（如果category中包含"官方音色"）
+    categories = frozenset(cat.strip() for cat in category.split(";"))
+    is_official = "官方音色" in categories
+    # 判断是否为收藏（如果category中包含"收藏"）
+    is_favorite = "收藏" in categories
+    
+    # 读取uid（支持uuid或uid字段）
+    model_uid = model_info.get("uuid") or model_info.get("uid")
+    
+    # 构建模型数据（兼容管理页面的数据结构）
+    model_data = {
+        "name": model_name,
+        "image": model_image,
+        "description": model_info.get("description", ""),
+        "category": category,
+        "is_official": is_official,
+        "is_favorite": is_favorite,  # 从category字段中判断，如果包含"收藏"则为True
+        "version": model_info.get("version", "V1"),
+        "sample_rate": model_info.get("sample_rate", "48K"),
+        "pth_path": pth_path,
+        "index_path": index_path,
+        "uid": model_uid,  # 添加uid字段
+        # 过滤时直接使用的预处理字段，避免每次按键都重新拆分和大小写折叠
+        "_name_fold": model_name.casefold(),
+        "_category_set": categories,
+        "_json_path": json_path,  # 检查扫描缓存是否过期时用
+    }
+    
+    # 添加json中的其他信息（如果有）
+    for key in ["price", "category_name"]:
+        if key in model_info:
+            model_data[key] = model_info[key]
+
+    
+    return model_data
+
+
+def _json_mtimes(scanned):
+    """扫描结果中各模型 json 信息文件的修改时间（json 原地修改不会改变目录修改时间）"""
+    mtimes = []
+    for model_data in scanned:
+        if model_data is None or not model_data["_json_path"]:
+            continue
+        try:
+            mtimes.append(os.stat(model_data["_json_path"]).st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+
 class ManagementPage(BasePage):
     """管理页面"""
+    GRID_COLUMNS = 5  # 每行卡片数
+    SEARCH_DEBOUNCE_MS = 180  # 搜索框停止输入多久后才过滤
+    CARD_RECYCLER_SIZE = 200  # 回收备用的卡片数量上限
+    # 分类及其对应的图标
+    CATEGORIES = (
+        ("全部音色", "res/列表.png"),
+        ("官方音色", "res/官方核验.png"),
+        ("免费音色", "res/免费.png"),
+        ("收藏夹", "res/收藏.png"),
+    )
     
     def __init__(self):
         super().__init__("管理")
         self.models_data = []  # 存储所有模型数据
         self.filtered_models = []  # 过滤后的模型
+        self._model_by_id = {}  # 模型ID -> 模型数据
+        self._ngram_index = {}  # 模型名称的二元字符倒排索引，下标对应 models_data
+        self._shown_count = 0  # 已经放入网格的过滤结果数量（卡片随滚动逐行放入）
+        self._grid_models = []  # 当前网格对应的过滤结果
+        self._card_by_id = {}  # 已创建的卡片 {模型ID: ModelCard}，过滤条件变化时复用
+        self._card_recycler = []  # 从结果中移除的卡片，新模型出现时改绑数据后复用
+        self._last_stretch_row = 0  # 当前设置了弹性空间的网格行
+        self._models_dir = os.path.abspath("models")  # 本地模型目录
+        self._scan_cache = None  # 上次扫描models目录的结果
+        self._scan_cache_key = None  # 上次扫描时各模型目录的 (目录名, 修改时间)
+        self._scan_json_mtimes = None  # 上次扫描时各模型 json 信息文件的修改时间
         self.current_category = "全部音色"  # 当前选中的分类
         self.current_model = None  # 当前查看的模型
+        self._last_search_text = ""  # 上次过滤时使用的搜索词
+        # 搜索防抖：连续输入时只在停顿后过滤一次
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._on_search_timeout)
         self.setup_content()
         # 不在初始化时加载模型，等待登录成功后再加载
         # self.load_models()  # 加载模型数据
@@ -36,6 +203,9 @@ class ManagementPage(BasePage):
         if not main_layout:
             main_layout = QVBoxLayout(self)
         
+        # 模型卡片和详情页的样式来自主页共用的样式表，另加管理页自己的规则
+        self.setStyleSheet(MODEL_PAGE_QSS + MANAGEMENT_PAGE_QSS)
+        
         # 清除基类创建的默认内容
         while main_layout.count():
             child = main_layout.takeAt(0)
@@ -59,25 +229,7 @@ class ManagementPage(BasePage):
         # 模型网格区域
         scroll_area = QScrollArea()
         scroll_area.setWidgetResizable(True)
-        # 基础样式由全局样式表提供，只设置特殊样式
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: none;
-            }
-            QScrollBar:vertical {
-                background-color: #2d2d2d;
-                width: 8px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #8b5cf6;
-                border-radius: 6px;
-                min-height: 30px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #7c3aed;
-            }
-        """)
+        scroll_area.setProperty("model_scroll", True)
         
         # 网格容器
         grid_widget = QWidget()
@@ -88,6 +240,9 @@ class ManagementPage(BasePage):
         self.grid_layout = QGridLayout()
         self.grid_layout.setSpacing(20)
         self.grid_layout.setContentsMargins(0, 0, 0, 0)
+        # 设置列的对齐方式，使卡片靠左对齐
+        for col in range(self.GRID_COLUMNS):
+            self.grid_layout.setColumnStretch(col, 0)  # 不拉伸列，让卡片靠左
         
         grid_container.addLayout(self.grid_layout)
         grid_container.addStretch()  # 添加右侧拉伸，使卡片靠左对齐
@@ -96,15 +251,35 @@ class ManagementPage(BasePage):
         scroll_area.setWidget(grid_widget)
         list_layout.addWidget(scroll_area)
         
+        # 只为滚动到可见范围内的行创建卡片：滚动和视口大小变化时补齐
+        self.scroll_area = scroll_area
+        scroll_area.verticalScrollBar().valueChanged.connect(self._fill_visible_rows)
+        scroll_area.viewport().installEventFilter(self)
+        
         self.stacked_widget.addWidget(self.list_page)
         
         # 详情页面（初始为空，点击详情时创建）
         self.detail_page = None
     
+    def _make_category_button(self, category, icon_path):
+        """创建分类按钮，样式由 category_state 属性匹配页面样式表"""
+        btn = QPushButton(QIcon(icon_path), category)
+        btn.setCheckable(True)
+        btn.setCursor(hand_cursor())
+        btn.setIconSize(QSize(16, 16))  # 设置图标大小
+        # 分类名保存在按钮属性上，所有分类按钮共用一个槽函数
+        btn.setProperty("category", category)
+        btn.clicked.connect(self._on_category_btn_clicked)
+        
+        is_default = category == "全部音色"
+        btn.setChecked(is_default)
+        btn.setProperty("category_state", "all" if is_default else "idle")
+        return btn
+    
     def create_toolbar(self):
         """创建顶部工具栏"""
         toolbar = QWidget()
-        toolbar.setStyleSheet("background-color: transparent;")
+        toolbar.setProperty("model_toolbar", True)
         
         layout = QVBoxLayout(toolbar)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -115,56 +290,8 @@ class ManagementPage(BasePage):
         categories_layout.setSpacing(10)
         
         self.category_buttons = {}
-        # 定义分类及其对应的图标
-        categories_data = [
-            ("全部音色", "res/列表.png"),
-            ("官方音色", "res/官方核验.png"),
-            ("免费音色", "res/免费.png"),
-            ("收藏夹", "res/收藏.png")
-        ]
-        
-        for category, icon_path in categories_data:
-            # 创建图标
-            icon = QIcon(icon_path)
-            btn = QPushButton(icon, category)
-            btn.setCheckable(True)
-            btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            btn.setIconSize(QSize(16, 16))  # 设置图标大小
-            btn.clicked.connect(lambda checked, cat=category: self.on_category_changed(cat))
-            
-            if category == "全部音色":
-                btn.setChecked(True)
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #e74c3c;
-                        color: #ffffff;
-                        border: none;
-                        border-radius: 6px;
-                        padding: 8px 20px;
-                        font-size: 14px;
-                        font-weight: bold;
-                        text-align: left;
-                    }
-                """)
-            else:
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #2d2d2d;
-                        color: #ffffff;
-                        border: none;
-                        border-radius: 6px;
-                        padding: 8px 20px;
-                        font-size: 14px;
-                        text-align: left;
-                    }
-                    QPushButton:hover {
-                        background-color: #3d3d3d;
-                    }
-                    QPushButton:checked {
-                        background-color: #8b5cf6;
-                    }
-                """)
-            
+        for category, icon_path in self.CATEGORIES:
+            btn = self._make_category_button(category, icon_path)
             self.category_buttons[category] = btn
             categories_layout.addWidget(btn)
 
@@ -172,34 +299,12 @@ class ManagementPage(BasePage):
         
         # 当前选择指示器
         self.selection_indicator = QLabel(f"当前选择: {self.current_category}")
-        self.selection_indicator.setStyleSheet("""
-            QLabel {
-                background-color: #8b5cf6;
-                color: #ffffff;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 15px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-        """)
+        self.selection_indicator.setProperty("selection_indicator", True)
         categories_layout.addWidget(self.selection_indicator)
         
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("请输入你想要的声音")
-        # 基础样式由全局样式表提供，只设置特殊样式
-        self.search_input.setStyleSheet("""
-            QLineEdit {
-                background-color: #1e1e1e;
-                border: 2px solid #3d3d3d;
-                border-radius: 8px;
-                padding: 2px 15px;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border: 2px solid #8b5cf6;
-            }
-        """)
+        self.search_input.setProperty("model_search", True)
         self.search_input.textChanged.connect(self.on_search_changed)
         categories_layout.addWidget(self.search_input)
 
@@ -209,9 +314,7 @@ class ManagementPage(BasePage):
     
     def load_models(self):
         """从models目录加载模型数据"""
-        self.models_data = self.fetch_models_from_models_dir()
-        # 按模型名称排序
-        self.models_data.sort(key=lambda x: x.get("name", "").lower())
+        self._set_models_data(self.fetch_models_from_models_dir())
         self.filtered_models = self.models_data.copy()
         self.update_model_grid()
     
@@ -222,9 +325,7 @@ class ManagementPage(BasePage):
         current_search = self.search_input.text() if hasattr(self, 'search_input') else ""
         
         # 重新加载模型数据
-        self.models_data = self.fetch_models_from_models_dir()
-        # 按模型名称排序
-        self.models_data.sort(key=lambda x: x.get("name", "").lower())
+        self._set_models_data(self.fetch_models_from_models_dir())
         
         # 恢复筛选条件并应用筛选
         self.current_category = current_category
@@ -238,9 +339,16 @@ class ManagementPage(BasePage):
         # 应用筛选条件
         self.filter_models()
     
+    def _set_models_data(self, models_data):
+        """保存模型数据：按名称排序并重建ID索引和搜索索引"""
+        models_data.sort(key=lambda x: x["_name_fold"])
+        self.models_data = models_data
+        self._model_by_id = {model["id"]: model for model in models_data}
+        self._ngram_index = build_bigram_index([model["_name_fold"] for model in models_data])
+    
     def fetch_models_from_models_dir(self):
         """从models目录获取模型数据（只返回用户可用的模型）"""
-        models_dir = os.path.join(os.getcwd(), "models")
+        models_dir = self._models_dir
         models_data = []
         
         # 如果models目录不存在，返回空列表
@@ -250,74 +358,33 @@ class ManagementPage(BasePage):
         # 获取用户可用的模型UUID列表
         available_model_uids = self._get_user_available_model_uids()
         
-        # 扫描models目录下的所有子目录
+        # 扫描models目录下的所有子目录（按目录名排序，模型ID保持稳定）
+        with os.scandir(models_dir) as top:
+            model_dirs = sorted((entry for entry in top if entry.is_dir()), key=lambda entry: entry.name)
+        # 模型目录的增删和目录内文件的增删都会改变目录修改时间，
+        # json 信息文件原地修改则只改变它自己的修改时间，都没变时直接用上次的扫描结果
+        scan_key = tuple((entry.name, entry.stat().st_mtime_ns) for entry in model_dirs)
+        if scan_key == self._scan_cache_key and _json_mtimes(self._scan_cache) == self._scan_json_mtimes:
+            scanned = self._scan_cache
+        else:
+            # 各目录的文件读取互不依赖，放到线程池中并行（文件 I/O 期间会释放 GIL）
+            with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+                scanned = list(executor.map(
+                    _read_model_dir,
+                    [entry.path for entry in model_dirs],
+                    [entry.name for entry in model_dirs],
+                ))
+            self._scan_cache = scanned
+            self._scan_cache_key = scan_key
+            self._scan_json_mtimes = _json_mtimes(scanned)
+        
+        # 可用性检查可能要调用服务器接口，仍在当前线程中逐个进行
         model_id = 1
-        for item in os.listdir(models_dir):
-            model_dir_path = os.path.join(models_dir, item)
-            
-            # 只处理目录
-            if not os.path.isdir(model_dir_path):
+        for model_data in scanned:
+            if model_data is None:
                 continue
-            
-            # 查找.pth文件（文件名可以是任意的，只要扩展名是.pth即可）
-            pth_files = [f for f in os.listdir(model_dir_path) if f.endswith(".pth")]
-            if not pth_files:
-                continue  # 如果没有.pth文件，跳过这个目录
-            
-            # 查找index文件（文件名可以是任意的，只要扩展名是.index即可）
-            index_files = [f for f in os.listdir(model_dir_path) if f.endswith(".index")]
-            
-            # 查找json信息文件
-            json_files = [f for f in os.listdir(model_dir_path) if f.endswith(".json")]
-            
-            # 查找图片文件（支持常见图片格式）
-            image_extensions = (".png", ".jpg", ".jpeg", ".bmp", ".gif", ".webp")
-            image_files = [f for f in os.listdir(model_dir_path) 
-                          if f.lower().endswith(image_extensions)]
-            
-            # 使用第一个找到的.pth文件
-            pth_path = os.path.join(model_dir_path, pth_files[0])
-            
-            # 使用第一个找到的index文件，如果没有则设为空字符串
-            index_path = os.path.join(model_dir_path, index_files[0]) if index_files else ""
-            
-            # 读取json信息文件（如果存在）
-            model_info = {}
-            if json_files:
-                json_path = os.path.join(model_dir_path, json_files[0])
-                try:
-                    with open(json_path, 'r', encoding='utf-8') as f:
-                        model_info = json.load(f)
-                except Exception as e:
-                    print(f"读取模型信息文件失败 {json_path}: {e}")
-            
-            # 构建模型数据
-            model_name = model_info.get("name", item)  # 如果json中没有name，使用目录名
-            
-            # 确定模型图片路径（优先级：json中的image > 目录下的图片文件）
-            model_image = model_info.get("image", "")
-            if model_image:
-                # 如果json中指定了图片路径
-                if not os.path.isabs(model_image):
-                    # 如果是相对路径，转换为相对于模型目录的路径
-                    model_image = os.path.join(model_dir_path, model_image)
-            elif image_files:
-                # 如果json中没有指定，但目录下有图片文件，使用第一个找到的图片
-                model_image = os.path.join(model_dir_path, image_files[0])
-            else:
-                # 没有图片
-                model_image = ""
-            
-            # 获取分类信息（从json中读取，默认为"免费音色"，支持多个分类用分号分隔）
-            category = model_info.get("category", "免费音色")
-            # 判断是否为官方音色（如果category中包含"官方音色"）
-            categories = [cat.strip() for cat in category.split(";")]
-            is_official = "官方音色" in categories
-            # 判断是否为收藏（如果category中包含"收藏"）
-            is_favorite = "收藏" in categories
-            
-            # 读取uid（支持uuid或uid字段）
-            model_uid = model_info.get("uuid") or model_info.get("uid")
+            categories = model_data["_category_set"]
+            model_uid = model_data["uid"]
             
             # 判断是否为免费音色
             is_free_model = "免费音色" in categories
@@ -337,27 +404,8 @@ class ManagementPage(BasePage):
                         # 既不在可用列表，也没有试用，跳过
                         continue
             
-            # 构建模型数据（兼容管理页面的数据结构）
-            model_data = {
-                "id": f"m{model_id}",
-                "name": model_name,
-                "image": model_image,
-                "description": model_info.get("description", ""),
-                "category": category,
-                "is_official": is_official,
-                "is_favorite": is_favorite,  # 从category字段中判断，如果包含"收藏"则为True
-                "version": model_info.get("version", "V1"),
-                "sample_rate": model_info.get("sample_rate", "48K"),
-                "pth_path": pth_path,
-                "index_path": index_path,
-                "uid": model_uid,  # 添加uid字段
-            }
-            
-            # 添加json中的其他信息（如果有）
-            for key in ["price", "category_name"]:
-                if key in model_info:
-                    model_data[key] = model_info[key]
-            
+            # 扫描结果会被缓存复用，这里复制一份再编号
+            model_data = dict(model_data, id=f"m{model_id}")
             models_data.append(model_data)
             model_id += 1
         
@@ -458,6 +506,10 @@ class ManagementPage(BasePage):
             traceback.print_exc()
             return False
     
+    def _on_category_btn_clicked(self):
+        """分类按钮点击：从发送者的属性取分类名"""
+        self.on_category_changed(self.sender().property("category"))
+    
     def on_category_changed(self, category):
         """分类改变"""
         self.current_category = category
@@ -465,86 +517,71 @@ class ManagementPage(BasePage):
         # 更新当前选择指示器
         self.selection_indicator.setText(f"当前选择: {category}")
         
-        # 更新按钮样式
+        # 更新按钮样式：只切换动态属性并重新匹配样式，不重新解析样式表
         for cat, btn in self.category_buttons.items():
             if cat == category:
-                if category == "全部音色":
-                    btn.setStyleSheet("""
-                        QPushButton {
-                            background-color: #e74c3c;
-                            color: #ffffff;
-                            border: none;
-                            border-radius: 6px;
-                            padding: 8px 20px;
-                            font-size: 14px;
-                            font-weight: bold;
-                            text-align: left;
-                        }
-                    """)
-                else:
-                    btn.setStyleSheet("""
-                        QPushButton {
-                            background-color: #8b5cf6;
-                            color: #ffffff;
-                            border: none;
-                            border-radius: 6px;
-                            padding: 8px 20px;
-                            font-size: 14px;
-                            font-weight: bold;
-                            text-align: left;
-                        }
-                    """)
+                state = "all" if category == "全部音色" else "active"
             else:
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #2d2d2d;
-                        color: #ffffff;
-                        border: none;
-                        border-radius: 6px;
-                        padding: 8px 20px;
-                        font-size: 14px;
-                        text-align: left;
-                    }
-                    QPushButton:hover {
-                        background-color: #3d3d3d;
-                    }
-                """)
+                state = "idle"
+            btn.setChecked(cat == category)
+            # 状态没变的按钮不必重新匹配样式
+            if btn.property("category_state") == state:
+                continue
+            btn.setProperty("category_state", state)
+            btn.style().unpolish(btn)
+            btn.style().polish(btn)
         
         # 过滤模型
         self.filter_models()
     
     def on_search_changed(self, text):
-        """搜索文本改变"""
+        """搜索文本改变：重新开始防抖计时"""
+        self._search_timer.start()
+    
+    def _on_search_timeout(self):
+        """输入停顿后过滤；搜索词实际没变（如只加了空格）时不重建网格"""
+        if self.search_input.text().strip().casefold() == self._last_search_text:
+            return
         self.filter_models()
     
     def filter_models(self):
         """过滤模型"""
-        search_text = self.search_input.text().strip().lower()
+        self._search_timer.stop()
+        search_text = self.search_input.text().strip().casefold()
+        self._last_search_text = search_text
+        
+        # 搜索词至少两个字符时，先用二元组倒排索引求交集筛出候选，再逐个确认子串
+        candidates = self.models_data
+        if len(search_text) >= 2:
+            postings = [
+                self._ngram_index.get(search_text[i:i + 2], set())
+                for i in range(len(search_text) - 1)
+            ]
+            postings.sort(key=len)
+            candidates = [self.models_data[i] for i in sorted(set.intersection(*postings))]
         
         self.filtered_models = []
-        for model in self.models_data:
-            # 分类过滤（支持多个分类，用分号分隔）
+        for model in candidates:
+            # 分类过滤（支持多个分类，加载时已按分号拆分为集合）
+            model_categories = model["_category_set"]
             if self.current_category == "全部音色":
                 # 显示所有
                 pass
             elif self.current_category == "官方音色":
                 # 检查category字段中是否包含"官方音色"，或is_official字段
-                model_categories = [cat.strip() for cat in model.get("category", "").split(";")]
                 if "官方音色" not in model_categories and not model.get("is_official", False):
                     continue
             elif self.current_category == "免费音色":
                 # 检查category字段中是否包含"免费音色"，且不是官方音色
-                model_categories = [cat.strip() for cat in model.get("category", "").split(";")]
                 if "免费音色" not in model_categories and model.get("is_official", False):
                     continue
             elif self.current_category == "收藏夹":
                 # 检查category字段中是否包含"收藏"，或is_favorite字段
-                model_categories = [cat.strip() for cat in model.get("category", "").split(";")]
                 if "收藏" not in model_categories and not model.get("is_favorite", False):
                     continue
             
             # 搜索过滤
-            if search_text and search_text not in model["name"].lower():
+            if search_text and search_text not in model["_name_fold"]:
                 continue
             
             self.filtered_models.append(model)
@@ -552,38 +589,91 @@ class ManagementPage(BasePage):
         self.update_model_grid()
     
     def update_model_grid(self):
-        """更新模型网格"""
-        # 清除现有卡片
-        while self.grid_layout.count():
-            child = self.grid_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+        """更新模型网格：复用已有卡片，只创建新出现的、删除不再出现的"""
+        # 过滤结果没有变化时网格保持原样（包括滚动位置）
+        if self.filtered_models == self._grid_models:
+            return
         
-        # 添加模型卡片
-        columns = 5  # 每行5个
-        for i, model_data in enumerate(self.filtered_models):
-            card = ModelCard(model_data)
-            card.detail_clicked.connect(self.on_model_detail_clicked)
+        # 批量增删期间暂停重绘，结束后只刷新一次
+        grid_widget = self.grid_layout.parentWidget()
+        grid_widget.setUpdatesEnabled(False)
+        try:
+            # 从布局中取出卡片（不销毁），不在新结果中的卡片放入回收列表，超出上限的才删除
+            while self.grid_layout.count():
+                self.grid_layout.takeAt(0)
+            new_ids = {model["id"] for model in self.filtered_models}
+            for model_id in list(self._card_by_id):
+                if model_id not in new_ids:
+                    card = self._card_by_id.pop(model_id)
+                    if len(self._card_recycler) < self.CARD_RECYCLER_SIZE:
+                        card.hide()
+                        self._card_recycler.append(card)
+                    else:
+                        card.deleteLater()
+            # 保留的卡片先隐藏，滚动到所在行时再放回网格
+            for card in self._card_by_id.values():
+                card.hide()
+            self._grid_models = list(self.filtered_models)
+            self._shown_count = 0
             
-            row = i // columns
-            col = i % columns
-            self.grid_layout.addWidget(card, row, col)
-        
-        # 设置列的对齐方式，使卡片靠左对齐
-        for col in range(columns):
-            self.grid_layout.setColumnStretch(col, 0)  # 不拉伸列，让卡片靠左
+            # 先只放入当前可见的几行卡片
+            self.scroll_area.verticalScrollBar().setValue(0)
+            self._fill_visible_rows()
+        finally:
+            grid_widget.setUpdatesEnabled(True)
+    
+    def eventFilter(self, obj, event):
+        """网格视口大小变化时补齐可见行的卡片"""
+        if obj is self.scroll_area.viewport() and event.type() == QEvent.Type.Resize:
+            self._fill_visible_rows()
+        return super().eventFilter(obj, event)
+    
+    def _fill_visible_rows(self, *_):
+        """把滚动位置以下、视口底部以上各行的卡片放入网格（多预留一行），没有卡片的才创建"""
+        if self._shown_count >= len(self.filtered_models):
+            return
+        columns = self.GRID_COLUMNS
+        row_height = ModelCard.CARD_HEIGHT + self.grid_layout.spacing()
+        bottom = self.scroll_area.verticalScrollBar().value() + self.scroll_area.viewport().height()
+        rows = bottom // row_height + 2
+        end = min(rows * columns, len(self.filtered_models))
+        if end <= self._shown_count:
+            return
         
-        # 添加弹性空间（只在最后一行）
-        self.grid_layout.setRowStretch(self.grid_layout.rowCount(), 1)
+        # 批量放入卡片期间暂停布局计算，全部放好后只重新布局一次
+        self.grid_layout.setEnabled(False)
+        try:
+            for i in range(self._shown_count, end):
+                model = self.filtered_models[i]
+                card = self._card_by_id.get(model["id"])
+                if card is None:
+                    if self._card_recycler:
+                        card = self._card_recycler.pop()
+                        card.set_model(model)
+                    else:
+                        card = ModelCard(model)
+                        card.detail_clicked.connect(self.on_model_detail_clicked)
+                    self._card_by_id[model["id"]] = card
+                elif card.model_data != model:
+                    # 重新加载后同一ID的模型信息有变化
+                    card.set_model(model)
+                self.grid_layout.addWidget(card, i // columns, i % columns)
+                card.show()
+            self._shown_count = end
+            
+            # 弹性空间只放在最后一行卡片之后
+            last_row = (end + columns - 1) // columns
+            self.grid_layout.setRowStretch(self._last_stretch_row, 0)
+            self.grid_layout.setRowStretch(last_row, 1)
+            self._last_stretch_row = last_row
+        finally:
+            self.grid_layout.setEnabled(True)
+            self.grid_layout.activate()
     
     def on_model_detail_clicked(self, model_id):
         """模型详情按钮点击"""
         # 查找模型数据
-        model_data = None
-        for model in self.models_data:
-            if model["id"] == model_id:
-                model_data = model
-                break
+        model_data = self._model_by_id.get(model_id)
         
         if not model_data:
             QMessageBox.warning(self, "错误", "未找到模型信息")
@@ -591,28 +681,23 @@ class ManagementPage(BasePage):
         
         # 查找对应的 ModelCard，获取图片对象
         model_image = None
-        for i in range(self.grid_layout.count()):
-            item = self.grid_layout.itemAt(i)
-            if item and item.widget():
-                widget = item.widget()
-                if isinstance(widget, ModelCard) and widget.model_id == model_id:
-                    # 优先使用 movie（GIF），否则尝试从 image_label 获取 pixmap
-                    if hasattr(widget, 'movie') and widget.movie:
-                        # 创建新的 QMovie 实例（因为 QMovie 不能直接复制）
-                        # 如果 ModelCard 有图片路径，使用路径创建新的 QMovie
-                        if widget.model_image and os.path.exists(widget.model_image):
-                            model_image = QMovie(widget.model_image)
-                            model_image.start()
-                    elif hasattr(widget, 'image_label') and widget.image_label:
-                        # 尝试从 image_label 获取 pixmap
-                        pixmap = widget.image_label.pixmap()
-                        if pixmap and not pixmap.isNull():
-                            model_image = QPixmap(pixmap)
-                    break
-        
-        # 创建或更新详情页面
-        if self.detail_page:
-            self.detail_page.deleteLater()
+        widget = self._card_by_id.get(model_id)
+        if widget is not None:
+            # 优先使用 movie（GIF），否则尝试从 image_label 获取 pixmap
+            if hasattr(widget, 'movie') and widget.movie:
+                # 创建新的 QMovie 实例（因为 QMovie 不能直接复制）
+                # 如果 ModelCard 有图片路径，使用路径创建新的 QMovie
+                if widget.model_image and os.path.exists(widget.model_image):
+                    model_image = QMovie(widget.model_image)
+                    model_image.start()
+            elif not widget.has_placeholder and widget.model_image and os.path.exists(widget.model_image):
+                # 卡片上只有缩略图，详情页按路径加载原图（在线程池中解码，之后从缓存取）
+                model_image = widget.model_image
+            elif hasattr(widget, 'image_label') and widget.image_label and not widget.has_placeholder:
+                # 尝试从 image_label 获取 pixmap（备用方案）
+                pixmap = widget.image_label.pixmap()
+                if pixmap and not pixmap.isNull():
+                    model_image = QPixmap(pixmap)
         
         # 添加更多详情数据
         detail_data = model_data.copy()
@@ -621,26 +706,26 @@ class ManagementPage(BasePage):
             "version": "V1",
             "sample_rate": "48K",
             "category_name": "免费音色" if not detail_data.get("is_official", False) else "官方音色",
-            "description": detail_data.get("description", "茶韵悠悠可音袅袅少御音介于少女与御姐之间既有少女清脆又具御姐沉稳圆润柔和年龄感适中清嗓咳嗽呢喃细语悄悄话 笑声 自带情绪感")
+            "description": detail_data.get("description", DEFAULT_MODEL_DESCRIPTION)
         })
         
         # 管理页面的模型都是已购买/已下载的
-        # 尝试获取主窗口引用
-        main_window = None
-        parent = self.parent()
-        while parent:
-            if hasattr(parent, 'pages'):
-                main_window = parent
-                break
-            parent = parent.parent()
-        
-        self.detail_page = ModelDetailPage(detail_data, is_purchased=True, main_window=main_window, model_image=model_image)
-        self.detail_page.back_clicked.connect(self.show_list_page)
-        self.detail_page.setParent(self.stacked_widget)
-        
-        # 如果详情页面不在堆叠中，添加它
-        if self.stacked_widget.indexOf(self.detail_page) == -1:
+        # 详情页只创建一次，之后切换模型时复用
+        if self.detail_page is None:
+            # 尝试获取主窗口引用
+            main_window = None
+            parent = self.parent()
+            while parent:
+                if hasattr(parent, 'pages'):
+                    main_window = parent
+                    break
+                parent = parent.parent()
+            
+            self.detail_page = ModelDetailPage(detail_data, is_purchased=True, main_window=main_window, model_image=model_image)
+            self.detail_page.back_clicked.connect(self.show_list_page)
             self.stacked_widget.addWidget(self.detail_page)
+        else:
+            self.detail_page.set_model(detail_data, is_purchased=True, model_image=model_image)
         
         # 切换到详情页面
         self.stacked_widget.setCurrentWidget(self.detail_page)
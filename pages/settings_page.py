@@ -16,7 +16,7 @@ from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QFont, QPixmap
 
 from .base_page import BasePage
-from .tools import create_slider
+from .tools import create_slider, SLIDER_QSS
 
 
 class SettingsPage(BasePage):
@@ -59,6 +59,9 @@ class SettingsPage(BasePage):
             if child.widget():
                 child.widget().deleteLater()
         
+        # 页面内所有滑块共用一份样式表
+        self.setStyleSheet(SLIDER_QSS)
+        
         # 创建滚动区域
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
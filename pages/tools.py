@@ -3,6 +3,28 @@ from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSlider
 from PyQt6.QtCore import Qt
 
 
+# 滑块控件的样式：由调用方在页面或父面板上设置一次，容器、滑块和标签都按动态属性匹配
+SLIDER_QSS = """
+    QWidget[slider_container=true],
+    QWidget[slider_container=true] QSlider {
+        background-color: transparent;
+    }
+    QLabel[slider_label=true] {
+        color: #ffffff;
+        font-size: 14px;
+        border: none;
+        background-color: transparent;
+    }
+    QLabel[slider_value=true] {
+        color: #8b5cf6;
+        font-size: 14px;
+        font-weight: bold;
+        border: none;
+        background-color: transparent;
+    }
+"""
+
+
 def create_slider(label_text, value, min_val, max_val, default_val, step=1):
     """创建滑块控件，返回容器、滑块和值标签
     
@@ -24,14 +46,15 @@ def create_slider(label_text, value, min_val, max_val, default_val, step=1):
     layout = QVBoxLayout(container)
     layout.setContentsMargins(0, 0, 0, 0)
     layout.setSpacing(6)
-    container.setStyleSheet("background-color: transparent;")
+    # 样式由父级设置的 SLIDER_QSS 提供
+    container.setProperty("slider_container", True)
     
     # 标签和值
     label_layout = QHBoxLayout()
     label = QLabel(label_text)
-    label.setStyleSheet("color: #ffffff; font-size: 14px; border: none; background-color: transparent;")
+    label.setProperty("slider_label", True)
     value_label = QLabel(str(value))
-    value_label.setStyleSheet("color: #8b5cf6; font-size: 14px; font-weight: bold; border: none; background-color: transparent;")
+    value_label.setProperty("slider_value", True)
     value_label.setMinimumWidth(50)
     value_label.setAlignment(Qt.AlignmentFlag.AlignRight)
     